@@ -5,9 +5,10 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .client import Samsung2878Client
-from .const import CONF_DUID, CONF_TOKEN, DOMAIN
+from .const import CONF_DUID, CONF_MAC, CONF_TOKEN, DOMAIN
 from .coordinator import Samsung2878Coordinator
 
 PLATFORMS = [
@@ -22,13 +23,27 @@ PLATFORMS = [
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Samsung 2878 AC from a config entry."""
+    # Loading the certificate is blocking file I/O, so it cannot run on the
+    # event loop; do it once here rather than on the first connect.
+    ssl_context = await hass.async_add_executor_job(
+        Samsung2878Client.load_ssl_context
+    )
     client = Samsung2878Client(
         host=entry.data[CONF_HOST],
         port=entry.data[CONF_PORT],
         token=entry.data[CONF_TOKEN],
         duid=entry.data[CONF_DUID],
+        ssl_context=ssl_context,
+    )
+    # Every entity belongs to the same device; build its info once and let
+    # the platforms share it through the coordinator.
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.data[CONF_MAC])},
+        name=entry.title,
+        manufacturer="Samsung",
+        model="AC 2878 (AR12HSFSAWKN)",
     )
-    coordinator = Samsung2878Coordinator(hass, client)
+    coordinator = Samsung2878Coordinator(hass, client, device_info)
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
@@ -47,5 +62,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         coordinator: Samsung2878Coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
         await coordinator.client.disconnect()
     return unload_ok
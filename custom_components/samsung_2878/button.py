@@ -22,12 +22,7 @@ async def async_setup_entry(
     """Set up Samsung 2878 buttons from a config entry."""
     coordinator: Samsung2878Coordinator = hass.data[DOMAIN][entry.entry_id]
     mac = entry.data[CONF_MAC]
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, mac)},
-        name=entry.title,
-        manufacturer="Samsung",
-        model="AC 2878 (AR12HSFSAWKN)",
-    )
+    device_info = coordinator.device_info
     async_add_entities([
         ResetFilterAlarmButton(coordinator, mac, device_info),
         ResetPowerLoggingButton(coordinator, mac, device_info),
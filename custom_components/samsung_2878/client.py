@@ -5,36 +5,136 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import socket
 import ssl
-import xml.etree.ElementTree as ET
+import threading
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import Any
+
+# xml.etree.ElementTree is only a fallback for responses the regex scans cannot
+# handle (and for GetPowerUsage), so it is imported where it is used.
 
 _LOGGER = logging.getLogger(__name__)
 
 CERT_PATH = Path(__file__).parent / "ac14k_m.pem"
+_CERT_PATH_STR = str(CERT_PATH)
 
 CONNECT_TIMEOUT = 10
 IO_TIMEOUT = 10
 
+# TCP keepalive: start probing after 60s idle, every 20s, give up after 3 misses.
+# Lets the kernel notice a silently dropped socket (AC rebooted, Wi-Fi blip)
+# instead of us finding out via a read timeout on the next command.
+KEEPALIVE_IDLE = 60
+KEEPALIVE_INTERVAL = 20
+KEEPALIVE_COUNT = 3
+
+# Initial size of the preallocated receive buffer. A full DeviceState response
+# is a few KiB; the buffer grows (up to MAX_LINE_SIZE) only if a single line
+# does not fit, e.g. a long GetPowerUsage history.
+READ_BUFFER_SIZE = 8192
+MAX_LINE_SIZE = 1024 * 1024
+
+# One <Attr ID=".." Type=".." Value=".." /> element. DeviceState responses and
+# push updates are flat lists of these, so scanning with a regex is enough and
+# far cheaper than building an ElementTree for every line the AC sends.
+_ATTR_RE = re.compile(rb'<Attr\s+ID="([^"]+)"[^>]*?\sValue="([^"]*)"')
+# The Mode attribute of a (flat) GetPowerLoggingMode response.
+_MODE_RE = re.compile(rb'\sMode="([^"]*)"')
+# Shared result for lines without any Attr; callers only read it.
+_EMPTY_ATTRS: dict[str, str] = {}
+
+# Fixed parts of the DeviceControl envelope. The DUID sits between prefix and
+# mid; each client joins those once (see Samsung2878Client.__init__).
+_CTRL_PREFIX = b'<Request Type="DeviceControl"><Control CommandID="cmd00000" DUID="'
+_CTRL_MID = b'">'
+_CTRL_SUFFIX = b"</Control></Request>\r\n"
+_CTRL_ATTR = b'<Attr ID="%s" Value="%s" />'
+
+# The other requests, pre-encoded; the templates are filled with bytes %.
+_AUTH_REQUEST = b'<Request Type="AuthToken"><User Token="%s" /></Request>\r\n'
+_STATUS_REQUEST = b'<Request Type="DeviceState" DUID="%s"></Request>\r\n'
+_SW_INFO_REQUEST = b'<Request Type="GetSWInfo"></Request>\r\n'
+_GET_LOGGING_MODE_REQUEST = b'<Request Type="GetPowerLoggingMode"></Request>\r\n'
+_SET_LOGGING_MODE_REQUEST = (
+    b'<Request Type="SetPowerLoggingMode" Mode="%s"></Request>\r\n'
+)
+_RESET_LOGGING_REQUEST = b'<Request Type="ResetPowerLogging"></Request>\r\n'
+_POWER_USAGE_REQUEST = (
+    b'<Request Type="GetPowerUsage">'
+    b'<PowerUsage from="%s" to="%s" Unit="%s" />'
+    b"</Request>\r\n"
+)
+
 # Type of the callback the coordinator registers to receive real-time push
-# <Update> attributes off the background reader loop.
+# <Update> attributes as soon as the connection receives them.
 PushCallback = Callable[[dict[str, str]], None]
 
+# Every client presents the same bundled certificate, so a single SSL context
+# is built on first connect and shared by all clients (config entries, config
+# flow probes and reconnects) instead of re-reading and re-parsing the PEM each
+# time. The lock keeps concurrent first connects from building it twice; it is a
+# threading lock, taken in the executor, so it is not tied to any one event loop
+# (the CLI runs a fresh loop per command).
+_SSL_CONTEXT: ssl.SSLContext | None = None
+_SSL_LOCK = threading.Lock()
+
+# Set once the running event loop implementation has been checked (and, for
+# the stock selector loop, the uvloop hint logged) on the first connect.
+_LOOP_CHECKED = False
+
 # Placeholders the AC sends for registers it does not implement. Kept in sync
 # with const.SENTINEL_VALUES, duplicated here so the CLI can load client.py
 # standalone without pulling in Home Assistant. See const.py for rationale.
 SENTINEL_VALUES = frozenset({65024, 65535, 32768})
 
+# The AC reports "no error" in AC_FUN_ERROR in several spellings.
+_NO_ERROR: frozenset[str] = frozenset({"00000", "", "00", "0"})
+
+
+def _log_event_loop_once() -> None:
+    """Log a one-time hint when running on the default asyncio event loop.
+
+    The TLS read/write path is noticeably faster on uvloop (or an io_uring
+    loop such as uringcore); nothing changes functionally either way.
+    """
+    global _LOOP_CHECKED  # noqa: PLW0603
+    if _LOOP_CHECKED:
+        return
+    _LOOP_CHECKED = True
+    module = type(asyncio.get_running_loop()).__module__
+    if "uvloop" not in module and "uringcore" not in module:
+        _LOGGER.info(
+            "Samsung2878: default asyncio loop detected; installing uvloop is "
+            "recommended for lower TLS latency"
+        )
+
+
+def _to_int(raw: str) -> int | None:
+    """Parse an int, returning None for garbage.
+
+    Plain digit strings (nearly every register) and empty values (unsupported
+    registers) are decided up front, so only unusual input such as a sign or
+    padding reaches the raising int() path.
+    """
+    if raw.isdecimal():
+        return int(raw)
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        return None
+
 
 def _int_or_none(raw: str | None, *, guard_sentinel: bool = True) -> int | None:
     """Parse an int register, returning None for missing/garbage/sentinel values."""
     if raw is None:
         return None
-    try:
-        value = int(raw)
-    except (ValueError, TypeError):
+    value = _to_int(raw)
+    if value is None:
         return None
     if guard_sentinel and value in SENTINEL_VALUES:
         return None
@@ -53,9 +153,13 @@ class Samsung2878AuthError(Samsung2878Error):
     """Authentication error."""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Samsung2878State:
-    """Parsed AC state."""
+    """Parsed AC state.
+
+    Immutable: derive updated snapshots with ``dataclasses.replace``, so a
+    changed state is always a new object and ``is`` detects no-op updates.
+    """
 
     power: bool = False
     mode: str = "Auto"
@@ -81,138 +185,335 @@ class Samsung2878State:
     raw: dict[str, str] = field(default_factory=dict)
 
 
-def _parse_state(attrs: dict[str, str]) -> Samsung2878State:
-    """Parse raw attribute dict into Samsung2878State."""
-    state = Samsung2878State(raw=attrs)
+def _is_on(raw: str) -> bool:
+    """Parse an On/Off register."""
+    return raw == "On"
 
-    state.power = attrs.get("AC_FUN_POWER", "Off") == "On"
-    state.mode = attrs.get("AC_FUN_OPMODE", "Auto")
-    state.fan_mode = attrs.get("AC_FUN_WINDLEVEL", "Auto")
-    state.swing_mode = attrs.get("AC_FUN_DIRECTION", "Off")
 
-    comode = attrs.get("AC_FUN_COMODE", "Off")
-    state.preset = comode if comode != "Off" else "Off"
-
-    # Current temperature
+def _float_or_zero(raw: str) -> float:
+    """Parse a float register, returning 0.0 for garbage."""
+    if raw.isdecimal():
+        return float(raw)
+    if not raw:
+        return 0.0
     try:
-        state.current_temp = float(attrs.get("AC_FUN_TEMPNOW", "0"))
-    except (ValueError, TypeError):
-        state.current_temp = 0.0
+        return float(raw)
+    except ValueError:
+        return 0.0
 
-    # Target temperature - 0 defaults to 24, <8 and !=0 defaults to 16
-    try:
-        raw_target = int(attrs.get("AC_FUN_TEMPSET", "24"))
-        if raw_target == 0:
-            raw_target = 24
-        elif raw_target < 8:
-            raw_target = 16
-        state.target_temp = raw_target
-    except (ValueError, TypeError):
-        state.target_temp = 24
-
-    # Outdoor temperature (raw - 55)
-    raw_outdoor = attrs.get("AC_OUTDOOR_TEMP")
-    if raw_outdoor is not None:
-        try:
-            state.outdoor_temp = float(raw_outdoor) - 55
-        except (ValueError, TypeError):
-            state.outdoor_temp = None
 
-    # Error
-    error = attrs.get("AC_FUN_ERROR", "")
-    if error in ("00000", "", "00", "0"):
-        state.error = ""
-    else:
-        state.error = error
+def _int_or_zero(raw: str) -> int:
+    """Parse an int register, returning 0 for garbage."""
+    value = _to_int(raw)
+    return value if value is not None else 0
 
-    # Auto clean
-    state.auto_clean = attrs.get("AC_ADD_AUTOCLEAN", "Off") == "On"
 
-    # Sleep timer (minutes)
+def _tenths_or_none(raw: str) -> float | None:
+    """Parse a fixed-point register reported in tenths (35 -> 3.5)."""
+    value = _int_or_none(raw)
+    return value / 10.0 if value is not None else None
+
+
+def _text_or_none(raw: str) -> str | None:
+    """Parse a free-text register, mapping an empty value to None."""
+    return raw or None
+
+
+def _target_temp(raw: str) -> int:
+    """Parse the setpoint: 0/garbage defaults to 24, <8 and !=0 to 16."""
+    value = _int_or_none(raw, guard_sentinel=False)
+    if value is None or value == 0:
+        return 24
+    if value < 8:
+        return 16
+    return value
+
+
+def _outdoor_temp(raw: str) -> float | None:
+    """Parse the outdoor temperature (raw - 55)."""
+    if raw.isdecimal():
+        return float(raw) - 55
+    if not raw:
+        return None
     try:
-        state.sleep_timer = int(attrs.get("AC_FUN_SLEEP", "0"))
-    except (ValueError, TypeError):
-        state.sleep_timer = 0
+        return float(raw) - 55
+    except ValueError:
+        return None
 
-    # Instantaneous power draw (watts). Unsupported on some models, which report
-    # a sentinel (e.g. 65024 on the AR12HSFS) -> dropped by _int_or_none.
-    state.used_watt = _int_or_none(attrs.get("AC_ADD2_USEDWATT"))
 
+def _error_code(raw: str) -> str:
+    """Normalize the error register to "" when there is no error."""
+    return "" if raw in _NO_ERROR else raw
+
+
+# (register, state field, converter, default when the register is absent).
+# Every state field is derived from exactly one register, so _parse_state walks
+# this once per snapshot and merge_push only converts the registers a push
+# actually carries.
+_PARSE_TABLE: tuple[tuple[str, str, Callable[[str], Any], Any], ...] = (
+    ("AC_FUN_POWER", "power", _is_on, False),
+    ("AC_FUN_OPMODE", "mode", str, "Auto"),
+    ("AC_FUN_WINDLEVEL", "fan_mode", str, "Auto"),
+    ("AC_FUN_DIRECTION", "swing_mode", str, "Off"),
+    ("AC_FUN_COMODE", "preset", str, "Off"),
+    ("AC_FUN_TEMPNOW", "current_temp", _float_or_zero, 0.0),
+    ("AC_FUN_TEMPSET", "target_temp", _target_temp, 24),
+    ("AC_OUTDOOR_TEMP", "outdoor_temp", _outdoor_temp, None),
+    ("AC_FUN_ERROR", "error", _error_code, ""),
+    ("AC_ADD_AUTOCLEAN", "auto_clean", _is_on, False),
+    # Sleep timer (minutes)
+    ("AC_FUN_SLEEP", "sleep_timer", _int_or_zero, 0),
+    # Instantaneous power draw (watts). Unsupported on some models, which
+    # report a sentinel (e.g. 65024 on the AR12HSFS) -> dropped by _int_or_none.
+    ("AC_ADD2_USEDWATT", "used_watt", _int_or_none, None),
     # Filter usage time (hours)
-    state.filter_use_time = _int_or_none(attrs.get("AC_ADD2_FILTER_USE_TIME"))
-
+    ("AC_ADD2_FILTER_USE_TIME", "filter_use_time", _int_or_none, None),
     # SPI (ionizer)
-    state.spi = attrs.get("AC_ADD_SPI", "Off") == "On"
-
+    ("AC_ADD_SPI", "spi", _is_on, False),
     # Lifetime energy (kWh) and operating time (hours). Like the capability
     # registers below, these are fixed-point in tenths: AC_ADD2_USEDPOWER is
-    # 0.1 kWh/count and AC_ADD2_USEDTIME is 0.1 h/count (matching the documented
-    # "AC_ADD2_USEDWATT raw/10 = kWh" convention). Taking them raw over-reported
-    # by 10x; e.g. 6404 -> 640.4 kWh, 10820 -> 1082.0 h. The 10x raw scale is
-    # also physically impossible for time (the counter "gained" 330 h over a
-    # 240 h wall-clock window) and implied a ~5.9 kW average draw on a 3.5 kW
-    # unit; /10 yields a sane ~0.59 kW average. See PROTOCOL.md.
-    raw_used_power = _int_or_none(attrs.get("AC_ADD2_USEDPOWER"))
-    state.used_power = raw_used_power / 10.0 if raw_used_power is not None else None
-    raw_used_time = _int_or_none(attrs.get("AC_ADD2_USEDTIME"))
-    state.used_time = raw_used_time / 10.0 if raw_used_time is not None else None
-
+    # 0.1 kWh/count and AC_ADD2_USEDTIME is 0.1 h/count (matching the
+    # documented "AC_ADD2_USEDWATT raw/10 = kWh" convention). Taking them raw
+    # over-reported by 10x; e.g. 6404 -> 640.4 kWh, 10820 -> 1082.0 h. The 10x
+    # raw scale is also physically impossible for time (the counter "gained"
+    # 330 h over a 240 h wall-clock window) and implied a ~5.9 kW average draw
+    # on a 3.5 kW unit; /10 yields a sane ~0.59 kW average. See PROTOCOL.md.
+    ("AC_ADD2_USEDPOWER", "used_power", _tenths_or_none, None),
+    ("AC_ADD2_USEDTIME", "used_time", _tenths_or_none, None),
     # Rated cool/warm capability, reported in tenths of a kW (35 -> 3.5 kW)
-    raw_cool = _int_or_none(attrs.get("AC_COOL_CAPABILITY"))
-    state.cool_capability = raw_cool / 10.0 if raw_cool is not None else None
-    raw_warm = _int_or_none(attrs.get("AC_WARM_CAPABILITY"))
-    state.warm_capability = raw_warm / 10.0 if raw_warm is not None else None
-
+    ("AC_COOL_CAPABILITY", "cool_capability", _tenths_or_none, None),
+    ("AC_WARM_CAPABILITY", "warm_capability", _tenths_or_none, None),
     # Filter time threshold (hours)
-    state.filter_time = _int_or_none(attrs.get("AC_ADD2_FILTERTIME"))
-
+    ("AC_ADD2_FILTERTIME", "filter_time", _int_or_none, None),
     # Firmware versions are exposed directly in DeviceState; prefer these over
     # the GetSWInfo request, which returns malformed XML on this firmware.
-    panel = attrs.get("AC_ADD2_PANEL_VERSION")
-    state.panel_version = str(panel) if panel else None
-    outdoor = attrs.get("AC_ADD2_OUT_VERSION")
-    state.outdoor_version = str(outdoor) if outdoor else None
+    ("AC_ADD2_PANEL_VERSION", "panel_version", _text_or_none, None),
+    ("AC_ADD2_OUT_VERSION", "outdoor_version", _text_or_none, None),
+)
 
-    return state
+# register -> (state field, converter), for applying push deltas.
+_PARSE_BY_REGISTER: dict[str, tuple[str, Callable[[str], Any]]] = {
+    key: (name, convert) for key, name, convert, _ in _PARSE_TABLE
+}
+
+
+def _parse_state(attrs: dict[str, str]) -> Samsung2878State:
+    """Parse raw attribute dict into Samsung2878State."""
+    values: dict[str, Any] = {}
+    for key, name, convert, default in _PARSE_TABLE:
+        raw = attrs.get(key)
+        values[name] = convert(raw) if raw is not None else default
+    return Samsung2878State(raw=attrs, **values)
+
+
+class _LineProtocol(asyncio.BufferedProtocol):
+    """Receive side of the AC connection: split the stream into lines.
+
+    asyncio decrypts incoming TLS records straight into the memoryview handed
+    out by ``get_buffer``, so data is not staged through a StreamReader first.
+    Each complete line is passed to ``on_line`` as bytes, stripped of its CR/LF
+    terminator. Also implements write flow control for ``drain``.
+    """
+
+    def __init__(
+        self,
+        on_line: Callable[[bytes], None],
+        on_lost: Callable[[Exception | None], None],
+    ) -> None:
+        self._buffer = bytearray(READ_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._used = 0
+        self._on_line: Callable[[bytes], None] | None = on_line
+        self._on_lost: Callable[[Exception | None], None] | None = on_lost
+        self._transport: asyncio.BaseTransport | None = None
+        self._paused = False
+        self._drain_waiter: asyncio.Future[None] | None = None
+        self.closed: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+    def detach(self) -> None:
+        """Stop forwarding lines and connection loss to the client."""
+        self._on_line = None
+        self._on_lost = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Remember the transport so an oversized line can abort it."""
+        self._transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return the free tail of the receive buffer."""
+        if self._used == len(self._buffer):
+            if self._used >= MAX_LINE_SIZE:
+                # The AC never sends lines anywhere near this long; treat it as
+                # a broken stream rather than buffering without bound.
+                _LOGGER.debug("Line exceeds %s bytes, dropping", MAX_LINE_SIZE)
+                self._used = 0
+                if self._transport is not None:
+                    self._transport.abort()
+            else:
+                grown = bytearray(len(self._buffer) * 2)
+                grown[: self._used] = self._view[: self._used]
+                self._buffer = grown
+                self._view = memoryview(grown)
+        return self._view[self._used :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Emit every complete line, then keep the trailing partial line.
+
+        All lines that arrived in one read (e.g. a push followed by the
+        response) are handed on in this single call.
+        """
+        end = self._used + nbytes
+        start = 0
+        newline = self._buffer.find(b"\n", self._used, end)
+        while newline != -1:
+            # Drop the CR of the AC's CRLF terminator within the slice, so the
+            # strip() below is normally a no-op instead of a second copy.
+            stop = newline
+            if stop > start and self._buffer[stop - 1] == 0x0D:
+                stop -= 1
+            line = bytes(self._view[start:stop]).strip()
+            start = newline + 1
+            if line and self._on_line is not None:
+                self._on_line(line)
+            newline = self._buffer.find(b"\n", start, end)
+        if start:
+            self._buffer[: end - start] = self._view[start:end]
+        self._used = end - start
+
+    @property
+    def writing_paused(self) -> bool:
+        """Return True while the transport is above its high-water mark."""
+        return self._paused
+
+    def pause_writing(self) -> None:
+        """Transport write buffer is above the high-water mark."""
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        """Transport write buffer drained; release a waiting ``drain``."""
+        self._paused = False
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def drain(self) -> None:
+        """Wait until the transport accepts more data."""
+        if self.closed.done():
+            raise ConnectionResetError("Connection lost")
+        if not self._paused:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._drain_waiter = waiter
+        await waiter
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Propagate EOF/errors to the client and wake any waiters."""
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(ConnectionResetError("Connection lost"))
+        if not self.closed.done():
+            self.closed.set_result(None)
+        on_lost = self._on_lost
+        self.detach()
+        if on_lost is not None:
+            on_lost(exc)
 
 
 class Samsung2878Client:
     """Async client for Samsung 2878 AC protocol."""
 
-    def __init__(self, host: str, port: int, token: str, duid: str) -> None:
+    __slots__ = (
+        "_authenticated",
+        "_ctrl_prefix",
+        "_duid",
+        "_handshake_lines",
+        "_host",
+        "_inflight_status",
+        "_io_lock",
+        "_lost_callback",
+        "_pending_response",
+        "_port",
+        "_protocol",
+        "_push_callback",
+        "_ssl_context",
+        "_status_request",
+        "_sw_info",
+        "_token",
+        "_transport",
+    )
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        token: str,
+        duid: str,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
         self._host = host
         self._port = port
         self._token = token
         self._duid = duid
-        self._reader: asyncio.StreamReader | None = None
-        self._writer: asyncio.StreamWriter | None = None
+        # Optional pre-built context (see load_ssl_context); without one the
+        # shared context is built in the executor on first connect.
+        self._ssl_context = ssl_context
+        # The request envelopes never change for the life of the client, so
+        # encode them once; each command only encodes its own <Attr> elements.
+        self._ctrl_prefix = _CTRL_PREFIX + duid.encode() + _CTRL_MID
+        self._status_request = _STATUS_REQUEST % duid.encode()
+        self._transport: asyncio.Transport | None = None
+        self._protocol: _LineProtocol | None = None
         self._authenticated = False
-        self._ssl_context: ssl.SSLContext | None = None
-        # A single background task owns every read on the socket and dispatches
-        # each line to either the in-flight command (via _pending_response) or
-        # the push callback. This lets the AC's unsolicited <Update> messages be
-        # applied in real time, and means reads are never issued concurrently.
-        self._reader_task: asyncio.Task[None] | None = None
-        self._pending_response: tuple[str | None, asyncio.Future[str]] | None = None
+        # Lines received before authentication completes (greeting,
+        # InvalidateAccount, AuthToken response) are queued for the inline
+        # handshake reads; None marks a lost connection.
+        self._handshake_lines: asyncio.Queue[bytes | None] = asyncio.Queue()
+        # After authentication the protocol dispatches each line as it arrives:
+        # <Response> lines fulfil the in-flight command (via _pending_response)
+        # and unsolicited <Update> pushes go to the push callback, so remote/app
+        # changes are applied in real time.
+        self._pending_response: (
+            tuple[bytes | None, asyncio.Future[bytes]] | None
+        ) = None
         self._push_callback: PushCallback | None = None
+        # Told when the AC closes an authenticated session, so the owner can
+        # re-establish the push stream without waiting for its next request.
+        self._lost_callback: Callable[[], None] | None = None
         # Serializes command submission so only one response is ever awaited at
-        # a time (writes go out one-at-a-time; the reader loop fulfils them).
+        # a time (writes go out one-at-a-time; the protocol fulfils them).
         self._io_lock = asyncio.Lock()
+        # A DeviceState request already on the wire. Concurrent get_status
+        # callers (poll + a command's refresh) share it instead of queueing a
+        # second identical request behind _io_lock.
+        self._inflight_status: asyncio.Task[Samsung2878State] | None = None
+        # Firmware versions do not change while the AC is up, so a successful
+        # GetSWInfo is kept across reconnects.
+        self._sw_info: dict[str, str] | None = None
 
     @property
     def connected(self) -> bool:
-        """Return True if connected, authenticated and the reader is alive."""
+        """Return True if the connection is open and authenticated."""
         return (
-            self._writer is not None
+            self._transport is not None
             and self._authenticated
-            and self._reader_task is not None
-            and not self._reader_task.done()
+            and not self._transport.is_closing()
         )
 
     def set_push_callback(self, callback: PushCallback | None) -> None:
         """Register a callback invoked with attrs from each push <Update>."""
         self._push_callback = callback
 
+    def set_connection_lost_callback(
+        self, callback: Callable[[], None] | None
+    ) -> None:
+        """Register a callback invoked when the AC drops an authenticated session.
+
+        Not invoked for ``disconnect()`` or for failures during connect.
+        """
+        self._lost_callback = callback
+
     @staticmethod
     def merge_push(
         current: Samsung2878State, attrs: dict[str, str]
@@ -220,84 +521,160 @@ class Samsung2878Client:
         """Return a new state: ``current`` overlaid with push ``attrs``.
 
         Push <Update> messages carry only the registers that changed, so they
-        are merged over the last full snapshot's raw attributes and re-parsed.
+        are merged over the last full snapshot's raw attributes and only the
+        fields those registers feed are re-converted. A push that changes
+        nothing returns ``current`` itself, without copying.
         """
-        merged = dict(current.raw)
-        merged.update(attrs)
-        return _parse_state(merged)
+        raw = current.raw
+        raw_changed = False
+        changes: dict[str, Any] = {}
+        for key, value in attrs.items():
+            if raw.get(key) != value:
+                raw_changed = True
+            spec = _PARSE_BY_REGISTER.get(key)
+            if spec is not None:
+                name, convert = spec
+                # Compare converted values, not raw ones: an optimistic update
+                # may have moved the field away from its raw register.
+                converted = convert(value)
+                if getattr(current, name) != converted:
+                    changes[name] = converted
+        if not raw_changed and not changes:
+            return current
+        return replace(current, raw={**raw, **attrs}, **changes)
 
     @staticmethod
     def _create_ssl_context() -> ssl.SSLContext:
-        """Create SSL context (blocking I/O — must run in executor)."""
+        """Create SSL context (blocking I/O — must run in executor).
+
+        The handshake and record I/O run in the event loop's TLS layer, which
+        is faster on uvloop. The client never installs a loop policy itself:
+        the hosting application (Home Assistant, the CLI) owns the loop.
+        """
         ctx = ssl.SSLContext(ssl.PROTOCOL_TLSv1)
         ctx.set_ciphers("HIGH:!DH:!aNULL:@SECLEVEL=0")
-        ctx.load_verify_locations(str(CERT_PATH))
-        ctx.load_cert_chain(str(CERT_PATH))
+        ctx.load_verify_locations(_CERT_PATH_STR)
+        ctx.load_cert_chain(_CERT_PATH_STR)
         ctx.check_hostname = False
         ctx.verify_mode = ssl.CERT_NONE
         return ctx
 
+    @classmethod
+    def load_ssl_context(cls) -> ssl.SSLContext:
+        """Return the shared SSL context, building it on first use.
+
+        Blocking: call it from an executor, e.g. at integration setup, and
+        pass the result as ``ssl_context`` so connects never leave the loop.
+        """
+        global _SSL_CONTEXT  # noqa: PLW0603
+        with _SSL_LOCK:
+            if _SSL_CONTEXT is None:
+                _SSL_CONTEXT = cls._create_ssl_context()
+            return _SSL_CONTEXT
+
+    @classmethod
+    async def _get_ssl_context(cls) -> ssl.SSLContext:
+        """Return the shared SSL context; only the first call uses the executor."""
+        if _SSL_CONTEXT is not None:
+            return _SSL_CONTEXT
+        return await asyncio.to_thread(cls.load_ssl_context)
+
     async def connect(self) -> None:
         """Establish TLS connection to the AC."""
-        if self._ssl_context is None:
-            self._ssl_context = await asyncio.to_thread(
-                self._create_ssl_context
-            )
+        _log_event_loop_once()
+        ssl_context = self._ssl_context or await self._get_ssl_context()
+        loop = asyncio.get_running_loop()
+        self._handshake_lines = asyncio.Queue()
 
         try:
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(
-                    self._host, self._port, ssl=self._ssl_context
-                ),
-                timeout=CONNECT_TIMEOUT,
-            )
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                self._transport, self._protocol = await loop.create_connection(
+                    lambda: _LineProtocol(self._on_line, self._on_connection_lost),
+                    self._host,
+                    self._port,
+                    ssl=ssl_context,
+                )
         except (OSError, asyncio.TimeoutError) as err:
             raise Samsung2878ConnectionError(
                 f"Cannot connect to {self._host}:{self._port}: {err}"
             ) from err
 
+        self._configure_socket()
         _LOGGER.debug("Connected to %s:%s", self._host, self._port)
 
+    def _configure_socket(self) -> None:
+        """Set TCP_NODELAY and keepalive on the underlying socket (best effort).
+
+        Every command is a small request awaiting a reply, so Nagle's algorithm
+        could only hold it back. The stock asyncio transports already disable
+        it; set it explicitly so other event loop implementations match.
+        """
+        transport = self._transport
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as err:
+            _LOGGER.debug("Could not set TCP_NODELAY: %s", err)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # The tuning knobs are platform specific (Linux names shown).
+            for name, value in (
+                ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+                ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+                ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+            ):
+                option = getattr(socket, name, None)
+                if option is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, option, value)
+        except OSError as err:
+            _LOGGER.debug("Could not enable TCP keepalive: %s", err)
+
     async def authenticate(self) -> None:
         """Authenticate with the AC using the saved token."""
-        if self._reader is None or self._writer is None:
+        if self._transport is None or self._protocol is None:
             raise Samsung2878ConnectionError("Not connected")
 
         try:
-            # Read DPLUG-1.6 greeting
-            line = await self._read_line()
-            _LOGGER.debug("Greeting: %s", line)
-
-            # Read InvalidateAccount update
-            line = await self._read_line()
-            _LOGGER.debug("InvalidateAccount: %s", line)
-
-            # Send AuthToken request
-            auth_xml = (
-                f'<Request Type="AuthToken">'
-                f'<User Token="{self._token}" />'
-                f"</Request>\r\n"
-            )
-            self._writer.write(auth_xml.encode())
-            await self._writer.drain()
-
-            # Read AuthToken response
-            line = await self._read_line()
-            _LOGGER.debug("AuthToken response: %s", line)
-
-            if 'Status="Okay"' not in line:
+            # One deadline for the whole exchange rather than one per line.
+            async with asyncio.timeout(IO_TIMEOUT):
+                # Read DPLUG-1.6 greeting
+                line = await self._read_line()
+                _LOGGER.debug("Greeting: %s", line)
+
+                # Read InvalidateAccount update
+                line = await self._read_line()
+                _LOGGER.debug("InvalidateAccount: %s", line)
+
+                # Send AuthToken request
+                self._transport.write(_AUTH_REQUEST % self._token.encode())
+                if self._protocol.writing_paused:
+                    await self._protocol.drain()
+
+                # Read AuthToken response
+                line = await self._read_line()
+                _LOGGER.debug("AuthToken response: %s", line)
+
+            if b'Status="Okay"' not in line:
                 raise Samsung2878AuthError(
-                    f"Authentication failed: {line}"
+                    "Authentication failed: "
+                    + line.decode("utf-8", errors="replace")
                 )
 
             self._authenticated = True
-            # Hand the socket over to the background reader for the rest of the
-            # session. All inline reads above happen before it starts.
-            self._start_reader()
+            # From here on lines are dispatched as they arrive. Anything the AC
+            # sent right behind the AuthToken response is still queued.
+            while not self._handshake_lines.empty():
+                queued = self._handshake_lines.get_nowait()
+                if queued is not None:
+                    self._dispatch_line(queued)
             _LOGGER.debug("Authenticated successfully")
 
         except Samsung2878Error:
             raise
+        except asyncio.TimeoutError as err:
+            raise Samsung2878ConnectionError("Read timeout") from err
         except Exception as err:
             raise Samsung2878ConnectionError(
                 f"Authentication error: {err}"
@@ -310,6 +687,8 @@ class Samsung2878Client:
         interleave with an in-flight command on the shared socket. HA callers
         should use this rather than calling ``connect``/``authenticate``
         directly (the CLI, which is single-task, still uses those).
+        Every request calls it itself (via ``_send_command``), so a dropped
+        socket is re-established lazily on the next request.
         """
         if self.connected:
             return
@@ -318,39 +697,32 @@ class Samsung2878Client:
             # we waited.
             if self.connected:
                 return
-            # Tear down any half-dead connection (e.g. the reader loop exited on
-            # EOF) before opening a fresh one.
+            # Tear down any half-dead connection (e.g. the AC closed the socket)
+            # before opening a fresh one.
             await self.disconnect()
             await self.connect()
             await self.authenticate()
 
     async def disconnect(self) -> None:
-        """Close the connection and stop the reader loop."""
+        """Close the connection."""
         self._authenticated = False
 
-        task = self._reader_task
-        self._reader_task = None
-        if task is not None and not task.done():
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            except Exception:  # noqa: BLE001
-                pass
-
         # Unblock any command still waiting on a response.
         self._fail_pending(Samsung2878ConnectionError("Disconnected"))
 
-        if self._writer is not None:
+        transport, protocol = self._transport, self._protocol
+        self._transport = None
+        self._protocol = None
+        if transport is not None and protocol is not None:
+            # Late lines or connection_lost from the old socket must not touch
+            # the state of a connection opened after this one.
+            protocol.detach()
             try:
-                self._writer.close()
-                await self._writer.wait_closed()
+                transport.close()
+                async with asyncio.timeout(IO_TIMEOUT):
+                    await asyncio.shield(protocol.closed)
             except Exception:  # noqa: BLE001
-                pass
-            finally:
-                self._writer = None
-                self._reader = None
+                transport.abort()
         _LOGGER.debug("Disconnected")
 
     async def get_status(self) -> Samsung2878State:
@@ -360,9 +732,34 @@ class Samsung2878Client:
         defaulted state: a missing register would otherwise read back as e.g.
         power Off / 24 °C and clobber the real state. Raising lets the
         coordinator keep the last good snapshot and retry/reconnect instead.
+
+        Concurrent callers are coalesced onto a single request.
         """
-        xml = f'<Request Type="DeviceState" DUID="{self._duid}"></Request>\r\n'
-        response = await self._send_command(xml, "DeviceState")
+        inflight = self._inflight_status
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        inflight = asyncio.create_task(self._fetch_status())
+        self._inflight_status = inflight
+        # Cleared when the request itself finishes, not when this caller
+        # returns: if it is cancelled, the request is still awaiting its
+        # reply, and a second DeviceState sent meanwhile could be matched
+        # to the wrong response.
+        inflight.add_done_callback(self._status_done)
+        # Shield so a cancelled caller does not cancel the request that
+        # other callers are waiting on.
+        return await asyncio.shield(inflight)
+
+    def _status_done(self, task: asyncio.Task[Samsung2878State]) -> None:
+        """Forget a finished DeviceState request."""
+        if self._inflight_status is task:
+            self._inflight_status = None
+        if not task.cancelled():
+            # Mark the error retrieved, in case every caller was cancelled.
+            task.exception()
+
+    async def _fetch_status(self) -> Samsung2878State:
+        """Send one DeviceState request and parse the response."""
+        response = await self._send_command(self._status_request, "DeviceState")
         if not response:
             raise Samsung2878ConnectionError("No DeviceState response received")
         attrs = self._parse_attrs(response)
@@ -380,7 +777,7 @@ class Samsung2878Client:
 
     async def set_temperature(self, temp: int) -> None:
         """Set the target temperature."""
-        await self._set_control({"AC_FUN_TEMPSET": str(temp)})
+        await self._set_control({"AC_FUN_TEMPSET": temp})
 
     async def set_fan_mode(self, fan: str) -> None:
         """Set the fan speed (Auto, Low, Mid, High, Turbo)."""
@@ -400,7 +797,7 @@ class Samsung2878Client:
 
     async def set_sleep_timer(self, minutes: int) -> None:
         """Set the sleep timer (0 = off, 1-420 minutes)."""
-        await self._set_control({"AC_FUN_SLEEP": str(minutes)})
+        await self._set_control({"AC_FUN_SLEEP": minutes})
 
     async def set_spi(self, on: bool) -> None:
         """Enable or disable SPI (ionizer)."""
@@ -408,16 +805,23 @@ class Samsung2878Client:
 
     async def set_filter_time(self, hours: int) -> None:
         """Set filter replacement threshold (180, 300, 500, 700 hours)."""
-        await self._set_control({"AC_ADD2_FILTERTIME": str(hours)})
+        await self._set_control({"AC_ADD2_FILTERTIME": hours})
 
     async def clear_filter_alarm(self) -> None:
         """Clear the filter cleaning alarm."""
         await self._set_control({"AC_ADD_CLEAR_FILTER_ALARM": "On"})
 
+    async def set_multiple(self, attrs: dict[str, str | int]) -> None:
+        """Set several registers in a single DeviceControl request."""
+        await self._set_control(attrs)
+
     async def get_sw_info(self) -> dict[str, str]:
-        """Request software version information."""
-        xml = '<Request Type="GetSWInfo"></Request>\r\n'
-        response = await self._send_command(xml, "GetSWInfo")
+        """Request software version information (cached once parsed)."""
+        if self._sw_info is not None:
+            return dict(self._sw_info)
+        response = (await self._send_command(_SW_INFO_REQUEST, "GetSWInfo")).decode(
+            "utf-8", errors="replace"
+        )
         # The device returns malformed XML (unclosed <PannelInfo>/<OutDoorInfo>
         # tags), so ET.fromstring fails. Extract each Version attribute by regex
         # instead. Note the device's tag is "SWInfo", not "SwInfo".
@@ -432,28 +836,28 @@ class Samsung2878Client:
                 result[key] = match.group(1)
         if not result:
             _LOGGER.warning("Failed to parse GetSWInfo: %s", response)
+        else:
+            self._sw_info = dict(result)
         return result
 
     async def get_power_logging_mode(self) -> str:
         """Get current power logging mode."""
-        xml = '<Request Type="GetPowerLoggingMode"></Request>\r\n'
-        response = await self._send_command(xml, "GetPowerLoggingMode")
-        try:
-            root = ET.fromstring(response)
-            return root.get("Mode", "Unknown")
-        except ET.ParseError:
-            return "Unknown"
+        response = await self._send_command(
+            _GET_LOGGING_MODE_REQUEST, "GetPowerLoggingMode"
+        )
+        match = _MODE_RE.search(response)
+        return match.group(1).decode() if match else "Unknown"
 
     async def set_power_logging_mode(self, enable: bool) -> None:
         """Enable or disable power logging."""
-        mode = "Enable" if enable else "Disable"
-        xml = f'<Request Type="SetPowerLoggingMode" Mode="{mode}"></Request>\r\n'
-        await self._send_command(xml, "SetPowerLoggingMode")
+        mode = b"Enable" if enable else b"Disable"
+        await self._send_command(
+            _SET_LOGGING_MODE_REQUEST % mode, "SetPowerLoggingMode"
+        )
 
     async def reset_power_logging(self) -> None:
         """Reset power logging data."""
-        xml = '<Request Type="ResetPowerLogging"></Request>\r\n'
-        await self._send_command(xml, "ResetPowerLogging")
+        await self._send_command(_RESET_LOGGING_REQUEST, "ResetPowerLogging")
 
     async def get_power_usage(
         self, date_from: str, date_to: str, unit: str = "Day"
@@ -463,12 +867,14 @@ class Samsung2878Client:
         date_from/date_to format: yy-MM-dd HH:mm
         unit: Hour or Day
         """
-        xml = (
-            f'<Request Type="GetPowerUsage">'
-            f'<PowerUsage from="{date_from}" to="{date_to}" Unit="{unit}" />'
-            f"</Request>\r\n"
+        request = _POWER_USAGE_REQUEST % (
+            date_from.encode(),
+            date_to.encode(),
+            unit.encode(),
         )
-        response = await self._send_command(xml, "GetPowerUsage")
+        response = await self._send_command(request, "GetPowerUsage")
+        import xml.etree.ElementTree as ET
+
         entries: list[dict[str, str]] = []
         try:
             root = ET.fromstring(response)
@@ -491,45 +897,76 @@ class Samsung2878Client:
         """Send raw XML command and return the response."""
         if not xml.endswith("\r\n"):
             xml += "\r\n"
-        return await self._send_command(xml, None)
+        response = await self._send_command(xml, None)
+        return response.decode("utf-8", errors="replace")
 
-    async def _set_control(self, attrs: dict[str, str]) -> None:
-        """Send a DeviceControl command."""
-        attr_xml = "".join(
-            f'<Attr ID="{k}" Value="{v}" />' for k, v in attrs.items()
-        )
-        xml = (
-            f'<Request Type="DeviceControl">'
-            f'<Control CommandID="cmd00000" DUID="{self._duid}">'
-            f"{attr_xml}"
-            f"</Control>"
-            f"</Request>\r\n"
-        )
-        response = await self._send_command(xml, "DeviceControl")
-        if response is not None and 'Status="Okay"' not in response:
+    async def _set_control(self, attrs: dict[str, str | int]) -> None:
+        """Send a DeviceControl command.
+
+        Values may be given as ``int`` (temperatures, minutes, hours); they
+        are formatted straight to bytes rather than via ``str``.
+        """
+        # The chunks go to the transport's writelines as-is; there is no
+        # intermediate join.
+        chunks = [self._ctrl_prefix]
+        for key, value in attrs.items():
+            chunks.append(
+                _CTRL_ATTR
+                % (
+                    key.encode(),
+                    b"%d" % value if isinstance(value, int) else value.encode(),
+                )
+            )
+        chunks.append(_CTRL_SUFFIX)
+        response = await self._send_command(chunks, "DeviceControl")
+        if response is not None and b'Status="Okay"' not in response:
             _LOGGER.warning("Control command may have failed: %s", response)
 
     async def _send_command(
-        self, xml: str, response_type: str | None = None
-    ) -> str:
-        """Send an XML command and await its <Response>.
-
-        The background reader owns the socket and resolves the future stored in
-        ``_pending_response`` when the matching <Response> arrives; unsolicited
-        <Update> pushes are dispatched to the callback instead. ``_io_lock``
-        keeps commands one-at-a-time so only a single response is ever awaited.
+        self, xml: str | bytes | list[bytes], response_type: str | None = None
+    ) -> bytes:
+        """Send an XML command and await its <Response> line.
+
+        ``xml`` is a request string, a pre-encoded request, or a list of
+        pre-encoded chunks; bytes are handed to the transport as-is.
+
+        The protocol resolves the future stored in ``_pending_response`` when
+        the matching <Response> arrives; unsolicited <Update> pushes are
+        dispatched to the callback instead. ``_io_lock`` keeps commands
+        one-at-a-time so only a single response is ever awaited.
+
+        Connects and authenticates first if the socket is not open.
         """
+        await self.ensure_connected()
         async with self._io_lock:
-            if not self.connected or self._writer is None:
+            if (
+                not self.connected
+                or self._transport is None
+                or self._protocol is None
+            ):
                 raise Samsung2878ConnectionError("Not connected")
 
             loop = asyncio.get_running_loop()
-            future: asyncio.Future[str] = loop.create_future()
-            self._pending_response = (response_type, future)
+            future: asyncio.Future[bytes] = loop.create_future()
+            marker = (
+                f'Type="{response_type}"'.encode() if response_type else None
+            )
+            self._pending_response = (marker, future)
             try:
-                self._writer.write(xml.encode())
-                await self._writer.drain()
-                return await asyncio.wait_for(future, IO_TIMEOUT)
+                if isinstance(xml, bytes):
+                    self._transport.write(xml)
+                elif isinstance(xml, str):
+                    self._transport.write(xml.encode())
+                else:
+                    self._transport.writelines(xml)
+                # A single deadline covers the drain and the response wait.
+                async with asyncio.timeout(IO_TIMEOUT):
+                    # Requests are a few hundred bytes at most, far below the
+                    # transport's high-water mark, so only wait for the buffer
+                    # to drain when it has actually signalled backpressure.
+                    if self._protocol.writing_paused:
+                        await self._protocol.drain()
+                    return await future
             except asyncio.TimeoutError as err:
                 raise Samsung2878ConnectionError("Response timeout") from err
             except Samsung2878Error:
@@ -539,63 +976,66 @@ class Samsung2878Client:
             finally:
                 self._pending_response = None
 
-    def _start_reader(self) -> None:
-        """Launch the background reader loop if not already running."""
-        if self._reader_task is None or self._reader_task.done():
-            self._reader_task = asyncio.create_task(self._read_loop())
+    def _on_line(self, line: bytes) -> None:
+        """Route a line from the protocol: handshake queue or dispatch."""
+        if self._authenticated:
+            self._dispatch_line(line)
+        else:
+            self._handshake_lines.put_nowait(line)
 
-    async def _read_loop(self) -> None:
-        """Read every line from the socket and dispatch it.
+    def _dispatch_line(self, line: bytes) -> None:
+        """Dispatch one post-authentication line.
 
-        Runs for the life of the connection. <Response> lines fulfil the
-        in-flight command; <Update> pushes are forwarded to the registered
-        callback so remote/app changes reach HA without waiting for the poll.
-        EOF or any read error ends the loop and marks us disconnected; the
-        coordinator reconnects on its next poll or command.
+        <Response> lines fulfil the in-flight command; <Update> pushes are
+        forwarded to the registered callback so remote/app changes reach HA
+        without waiting for the poll.
         """
-        reader = self._reader
-        if reader is None:
-            return
-        try:
-            while True:
-                data = await reader.readline()
-                if not data:
-                    _LOGGER.debug("AC closed the connection")
-                    break
-                line = data.decode("utf-8", errors="replace").strip()
-                if not line:
-                    continue
-
-                if "<Update " in line:
-                    attrs = self._parse_attrs(line)
-                    if attrs:
-                        _LOGGER.debug("Push update: %s", attrs)
-                        callback = self._push_callback
-                        if callback is not None:
-                            try:
-                                callback(attrs)
-                            except Exception:  # noqa: BLE001
-                                _LOGGER.exception("Push callback raised")
-                elif "<Response " in line:
-                    self._deliver_response(line)
-                else:
-                    _LOGGER.debug("Ignoring line: %s", line)
-        except asyncio.CancelledError:
-            raise
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.debug("Reader loop stopped: %s", err)
-        finally:
-            self._authenticated = False
-            self._fail_pending(Samsung2878ConnectionError("Connection lost"))
+        if b"<Update " in line:
+            # Status-less pushes (a bare <Update> header) carry nothing to
+            # apply; skip the parse entirely.
+            if b"<Attr" not in line:
+                _LOGGER.debug("Ignoring empty push: %s", line)
+                return
+            attrs = self._parse_attrs(line)
+            if attrs:
+                _LOGGER.debug("Push update: %s", attrs)
+                callback = self._push_callback
+                if callback is not None:
+                    try:
+                        callback(attrs)
+                    except Exception:  # noqa: BLE001
+                        _LOGGER.exception("Push callback raised")
+        elif b"<Response " in line:
+            self._deliver_response(line)
+        else:
+            _LOGGER.debug("Ignoring line: %s", line)
+
+    def _on_connection_lost(self, exc: Exception | None) -> None:
+        """Mark the session dead when the AC closes or drops the socket.
+
+        The owner is notified (see ``set_connection_lost_callback``) if the
+        session was authenticated; otherwise the next request reconnects.
+        """
+        _LOGGER.debug("AC closed the connection: %s", exc)
+        was_authenticated = self._authenticated
+        self._authenticated = False
+        self._handshake_lines.put_nowait(None)
+        self._fail_pending(Samsung2878ConnectionError("Connection lost"))
+        callback = self._lost_callback
+        if was_authenticated and callback is not None:
+            try:
+                callback()
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Connection lost callback raised")
 
-    def _deliver_response(self, line: str) -> None:
+    def _deliver_response(self, line: bytes) -> None:
         """Fulfil the in-flight command future with a matching <Response>."""
         pending = self._pending_response
         if pending is None:
             _LOGGER.debug("Dropping unsolicited response: %s", line)
             return
-        response_type, future = pending
-        if response_type and f'Type="{response_type}"' not in line:
+        marker, future = pending
+        if marker and marker not in line:
             _LOGGER.debug("Ignoring mismatched response: %s", line)
             return
         if not future.done():
@@ -610,26 +1050,47 @@ class Samsung2878Client:
                 future.set_exception(err)
         self._pending_response = None
 
-    async def _read_line(self) -> str:
-        """Read a single line from the connection."""
-        if self._reader is None:
-            raise Samsung2878ConnectionError("Not connected")
-        try:
-            data = await asyncio.wait_for(
-                self._reader.readline(), timeout=IO_TIMEOUT
-            )
-        except asyncio.TimeoutError as err:
-            raise Samsung2878ConnectionError("Read timeout") from err
+    async def _read_line(self) -> bytes:
+        """Read a single handshake line from the connection.
 
-        if not data:
+        Has no timeout of its own; ``authenticate`` bounds the whole handshake.
+        Lines stay bytes; they are only decoded for an error message. Debug
+        logging passes them as lazy ``%s`` arguments, so nothing is formatted
+        unless debug logging is enabled.
+        """
+        if self._transport is None:
+            raise Samsung2878ConnectionError("Not connected")
+        data = await self._handshake_lines.get()
+        if data is None:
             raise Samsung2878ConnectionError("Connection closed by AC")
 
-        return data.decode("utf-8", errors="replace").strip()
+        return data
 
     @staticmethod
-    def _parse_attrs(xml_str: str) -> dict[str, str]:
-        """Parse Attr elements from an XML response string."""
-        attrs: dict[str, str] = {}
+    def _parse_attrs(xml_str: bytes) -> dict[str, str]:
+        """Parse Attr elements from a raw XML response line.
+
+        Uses the ``_ATTR_RE`` scan on the fast path, decoding only the captured
+        IDs and values. Lines it cannot fully handle (entity-escaped values,
+        or any ``<Attr`` tag the scan did not match, e.g. attributes in an
+        unexpected order) fall back to a full ElementTree parse. Lines with
+        nothing to extract return the shared, read-only ``_EMPTY_ATTRS``
+        instead of a new dict.
+        """
+        if b"<Attr" not in xml_str:
+            return _EMPTY_ATTRS
+        if b"&" not in xml_str:
+            pairs = _ATTR_RE.findall(xml_str)
+            # A partial match would silently drop the unmatched Attrs.
+            if pairs and len(pairs) == xml_str.count(b"<Attr "):
+                return {
+                    attr_id.decode(): value.decode("utf-8", errors="replace")
+                    for attr_id, value in pairs
+                }
+
+        import xml.etree.ElementTree as ET
+
+        attrs = {}
         try:
             root = ET.fromstring(xml_str)
             for attr_elem in root.iter("Attr"):
@@ -639,4 +1100,5 @@ class Samsung2878Client:
                     attrs[attr_id] = attr_val
         except ET.ParseError:
             _LOGGER.warning("Failed to parse XML: %s", xml_str)
+            return _EMPTY_ATTRS
         return attrs
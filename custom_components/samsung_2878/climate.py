@@ -13,9 +13,8 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.debounce import Debouncer
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -43,6 +42,15 @@ _LOGGER = logging.getLogger(__name__)
 # intermediate step. The UI still updates instantly via the optimistic state.
 TEMP_DEBOUNCE_SECONDS = 1.0
 
+# What the unit is doing while powered on in a given mode; anything else
+# (Auto) reports idle.
+HVAC_ACTION_MAP: dict[HVACMode, HVACAction] = {
+    HVACMode.COOL: HVACAction.COOLING,
+    HVACMode.HEAT: HVACAction.HEATING,
+    HVACMode.DRY: HVACAction.DRYING,
+    HVACMode.FAN_ONLY: HVACAction.FAN,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -92,12 +100,8 @@ class Samsung2878Climate(CoordinatorEntity[Samsung2878Coordinator], ClimateEntit
             if configured
             else list(ALL_SWING_MODES)
         )
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.data[CONF_MAC])},
-            name=entry.title,
-            manufacturer="Samsung",
-            model="AC 2878 (AR12HSFSAWKN)",
-        )
+        self._attr_device_info = coordinator.device_info
+        self._update_attrs()
 
     async def async_added_to_hass(self) -> None:
         """Create the temperature debouncer once hass is available."""
@@ -112,66 +116,41 @@ class Samsung2878Climate(CoordinatorEntity[Samsung2878Coordinator], ClimateEntit
         # Cancel any pending send if the entity is removed mid-debounce.
         self.async_on_remove(self._temp_debouncer.async_cancel)
 
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current HVAC mode."""
-        if not self.coordinator.data.power:
-            return HVACMode.OFF
-        return HVAC_MODE_MAP.get(self.coordinator.data.mode, HVACMode.AUTO)
-
-    @property
-    def hvac_action(self) -> HVACAction | None:
-        """Return current HVAC action."""
-        if not self.coordinator.data.power:
-            return HVACAction.OFF
-        mode = HVAC_MODE_MAP.get(self.coordinator.data.mode)
-        if mode == HVACMode.COOL:
-            return HVACAction.COOLING
-        if mode == HVACMode.HEAT:
-            return HVACAction.HEATING
-        if mode == HVACMode.DRY:
-            return HVACAction.DRYING
-        if mode == HVACMode.FAN_ONLY:
-            return HVACAction.FAN
-        return HVACAction.IDLE
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        return self.coordinator.data.current_temp or None
-
-    @property
-    def target_temperature(self) -> int | None:
-        """Return the target temperature."""
-        if not self.coordinator.data.power:
-            return None
-        return self.coordinator.data.target_temp
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the derived state attributes, then write state."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
-    @property
-    def fan_mode(self) -> str | None:
-        """Return the current fan mode."""
-        return self.coordinator.data.fan_mode
-
-    @property
-    def swing_mode(self) -> str | None:
-        """Return the current swing mode."""
-        return SWING_MODE_MAP.get(
-            self.coordinator.data.swing_mode, "Off"
-        )
+    def _update_attrs(self) -> None:
+        """Translate the AC state into HA values once per update.
 
-    @property
-    def preset_mode(self) -> str | None:
-        """Return the current preset mode."""
-        preset = self.coordinator.data.preset
-        if preset == "Off":
-            return None
-        return preset
+        Done here rather than in properties because HA reads every state
+        attribute on each write, while the AC state only changes on a poll,
+        push or command.
+        """
+        data = self.coordinator.data
+        if data.power:
+            hvac_mode = HVAC_MODE_MAP.get(data.mode, HVACMode.AUTO)
+            self._attr_hvac_mode = hvac_mode
+            self._attr_hvac_action = HVAC_ACTION_MAP.get(
+                hvac_mode, HVACAction.IDLE
+            )
+            self._attr_target_temperature = data.target_temp
+        else:
+            self._attr_hvac_mode = HVACMode.OFF
+            self._attr_hvac_action = HVACAction.OFF
+            self._attr_target_temperature = None
+        self._attr_current_temperature = data.current_temp or None
+        self._attr_fan_mode = data.fan_mode
+        self._attr_swing_mode = SWING_MODE_MAP.get(data.swing_mode, "Off")
+        self._attr_preset_mode = None if data.preset == "Off" else data.preset
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
         if hvac_mode == HVACMode.OFF:
-            await self.coordinator.send_command(
-                self.coordinator.client.set_power, False,
+            await self.coordinator.async_send_control(
+                {"AC_FUN_POWER": "Off"},
                 optimistic={"power": False},
             )
             return
@@ -180,14 +159,12 @@ class Samsung2878Climate(CoordinatorEntity[Samsung2878Coordinator], ClimateEntit
         if ac_mode is None:
             return
 
+        attrs = {"AC_FUN_OPMODE": ac_mode}
         if not self.coordinator.data.power:
-            await self.coordinator.send_command(
-                self.coordinator.client.set_power, True,
-                optimistic={"power": True},
-            )
-        await self.coordinator.send_command(
-            self.coordinator.client.set_mode, ac_mode,
-            optimistic={"power": True, "mode": ac_mode},
+            # Power on and switch mode in the same DeviceControl request.
+            attrs = {"AC_FUN_POWER": "On", **attrs}
+        await self.coordinator.async_send_control(
+            attrs, optimistic={"power": True, "mode": ac_mode},
         )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
@@ -203,9 +180,7 @@ class Samsung2878Climate(CoordinatorEntity[Samsung2878Coordinator], ClimateEntit
             return
         temp = int(temp)
         self._pending_temp = temp
-        if self.coordinator.data:
-            self.coordinator.data.target_temp = temp
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        self.coordinator.async_set_optimistic({"target_temp": temp})
         if self._temp_debouncer is not None:
             await self._temp_debouncer.async_call()
         else:  # pragma: no cover - debouncer is set in async_added_to_hass
@@ -222,37 +197,37 @@ class Samsung2878Climate(CoordinatorEntity[Samsung2878Coordinator], ClimateEntit
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set fan mode."""
-        await self.coordinator.send_command(
-            self.coordinator.client.set_fan_mode, fan_mode,
+        await self.coordinator.async_send_control(
+            {"AC_FUN_WINDLEVEL": fan_mode},
             optimistic={"fan_mode": fan_mode},
         )
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set swing mode."""
         ac_swing = SWING_MODE_REVERSE.get(swing_mode, "Off")
-        await self.coordinator.send_command(
-            self.coordinator.client.set_swing_mode, ac_swing,
+        await self.coordinator.async_send_control(
+            {"AC_FUN_DIRECTION": ac_swing},
             optimistic={"swing_mode": ac_swing},
         )
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
         ac_preset = PRESET_REVERSE.get(preset_mode, "Off")
-        await self.coordinator.send_command(
-            self.coordinator.client.set_preset, ac_preset,
+        await self.coordinator.async_send_control(
+            {"AC_FUN_COMODE": ac_preset},
             optimistic={"preset": ac_preset},
         )
 
     async def async_turn_on(self) -> None:
         """Turn the AC on."""
-        await self.coordinator.send_command(
-            self.coordinator.client.set_power, True,
+        await self.coordinator.async_send_control(
+            {"AC_FUN_POWER": "On"},
             optimistic={"power": True},
         )
 
     async def async_turn_off(self) -> None:
         """Turn the AC off."""
-        await self.coordinator.send_command(
-            self.coordinator.client.set_power, False,
+        await self.coordinator.async_send_control(
+            {"AC_FUN_POWER": "Off"},
             optimistic={"power": False},
         )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -18,6 +19,8 @@ from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
 
 from .client import (
+    CONNECT_TIMEOUT,
+    IO_TIMEOUT,
     Samsung2878AuthError,
     Samsung2878Client,
     Samsung2878ConnectionError,
@@ -79,9 +82,12 @@ class Samsung2878ConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
             try:
-                await client.connect()
-                await client.authenticate()
-            except Samsung2878ConnectionError:
+                # One deadline for the whole probe, so a half-responsive AC
+                # cannot stall the form.
+                async with asyncio.timeout(CONNECT_TIMEOUT + IO_TIMEOUT):
+                    await client.connect()
+                    await client.authenticate()
+            except (Samsung2878ConnectionError, TimeoutError):
                 errors["base"] = "cannot_connect"
             except Samsung2878AuthError:
                 errors["base"] = "invalid_auth"
@@ -89,7 +95,6 @@ class Samsung2878ConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected error during config flow")
                 errors["base"] = "unknown"
             else:
-                await client.disconnect()
                 return self.async_create_entry(
                     title=f"Samsung AC ({user_input[CONF_HOST]})",
                     data={
@@ -100,6 +105,10 @@ class Samsung2878ConfigFlow(ConfigFlow, domain=DOMAIN):
                         CONF_DUID: duid,
                     },
                 )
+            finally:
+                # Close the probe socket on failure too (e.g. a rejected
+                # token), not just after a successful handshake.
+                await client.disconnect()
 
         return self.async_show_form(
             step_id="user",
@@ -16,6 +16,11 @@ DEFAULT_PORT = 2878
 # <Update> messages (remote/app changes) keep flowing between polls. Raise it
 # to reduce traffic if your unit tolerates longer idles.
 DEFAULT_POLL_INTERVAL = 20
+# After a command, or a poll that finds the controls changed outside HA (remote,
+# app), poll faster for a while so the AC's own follow-up changes show up
+# quickly, then fall back to DEFAULT_POLL_INTERVAL.
+FAST_POLL_INTERVAL = 5
+FAST_POLL_DURATION = 60
 TEMP_MIN = 16
 TEMP_MAX = 30
 
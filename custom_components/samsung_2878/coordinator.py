@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Coroutine
+from dataclasses import replace
 from datetime import timedelta
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .client import (
@@ -18,33 +22,84 @@ from .client import (
     Samsung2878Error,
     Samsung2878State,
 )
-from .const import DEFAULT_POLL_INTERVAL, DOMAIN
+from .const import (
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    FAST_POLL_DURATION,
+    FAST_POLL_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_INTERVAL = timedelta(seconds=DEFAULT_POLL_INTERVAL)
+_FAST_INTERVAL = timedelta(seconds=FAST_POLL_INTERVAL)
+
+
+def _controls(state: Samsung2878State) -> tuple[Any, ...]:
+    """Return the user-controllable part of a state (not sensor readings)."""
+    return (
+        state.power,
+        state.mode,
+        state.target_temp,
+        state.fan_mode,
+        state.swing_mode,
+        state.preset,
+        state.sleep_timer,
+        state.auto_clean,
+        state.spi,
+    )
+
+
+def _consume_exception(future: asyncio.Future[None]) -> None:
+    """Mark a control batch's error as retrieved, even if nobody awaited it."""
+    if not future.cancelled():
+        future.exception()
+
 
 class Samsung2878Coordinator(DataUpdateCoordinator[Samsung2878State]):
     """Coordinator to poll Samsung 2878 AC state."""
 
-    def __init__(self, hass: HomeAssistant, client: Samsung2878Client) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: Samsung2878Client,
+        device_info: DeviceInfo,
+    ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_POLL_INTERVAL),
+            update_interval=_DEFAULT_INTERVAL,
+            # Skip notifying entities when a poll returns an identical state.
+            always_update=False,
         )
         self.client = client
+        self.device_info = device_info
         # Receive real-time push <Update> messages from the AC (remote/app
         # changes) instead of waiting for the next poll.
         client.set_push_callback(self._handle_push)
+        # Pushes only flow while a session is open; when the AC closes it,
+        # reconnect straight away rather than at the next poll.
+        client.set_connection_lost_callback(self._handle_connection_lost)
+        # DeviceControl registers queued in the current event loop tick by
+        # async_send_control, flushed to the AC as one request.
+        self._pending_control: dict[str, str] = {}
+        self._pending_optimistic: dict[str, Any] = {}
+        self._control_flush: asyncio.Future[None] | None = None
+        # Batches handed off to the client but not yet acknowledged by the AC.
+        self._control_sending: set[asyncio.Future[None]] = set()
+        # Loop time until which the poll runs at FAST_POLL_INTERVAL.
+        self._fast_poll_until = 0.0
+        # Cancels the one-off early poll scheduled after a command.
+        self._unsub_boost_refresh: CALLBACK_TYPE | None = None
 
     @callback
     def _handle_push(self, attrs: dict[str, str]) -> None:
         """Apply a real-time push <Update> to local state.
 
-        Invoked from the client's reader loop. Pushes carry only the changed
-        registers, so they are merged over the current snapshot. Ignored until
-        the first poll has populated ``self.data``.
+        Invoked from the client's connection protocol. Pushes carry only the
+        changed registers, so they are merged over the current snapshot.
+        Ignored until the first poll has populated ``self.data``.
 
         We update ``data`` and notify listeners directly rather than via
         ``async_set_updated_data``: the latter reschedules the poll, and since
@@ -53,13 +108,27 @@ class Samsung2878Coordinator(DataUpdateCoordinator[Samsung2878State]):
         """
         if not attrs or self.data is None:
             return
-        self.data = self.client.merge_push(self.data, attrs)
+        data = self.client.merge_push(self.data, attrs)
+        if data is self.data:
+            # Nothing changed (e.g. a periodic push repeating current values).
+            return
+        self.data = data
         self.async_update_listeners()
 
+    @callback
+    def _handle_connection_lost(self) -> None:
+        """Re-establish the session (and with it the push stream) promptly.
+
+        Goes through the refresh debouncer, so an AC that keeps closing the
+        socket is not reconnected to more than once per cooldown.
+        """
+        _LOGGER.debug("AC closed the session; refreshing to reconnect")
+        self.hass.async_create_task(self.async_request_refresh())
+
     async def _async_update_data(self) -> Samsung2878State:
         """Fetch data from the AC.
 
-        The AC silently drops its idle TLS socket between our 30s polls, so the
+        The AC silently drops its idle TLS socket between our polls, so the
         first read on a stale connection times out ("Read timeout"). That made
         the entity flap to ``unavailable`` for a poll on every reconnect. We now
         absorb the transient: on a connection error, drop the socket and retry
@@ -83,10 +152,26 @@ class Samsung2878Coordinator(DataUpdateCoordinator[Samsung2878State]):
                 raise UpdateFailed(f"Connection failed: {err2}") from err2
 
     async def _poll_once(self) -> Samsung2878State:
-        """Connect if needed and fetch one DeviceState snapshot."""
-        await self.client.ensure_connected()
+        """Fetch one DeviceState snapshot."""
+        # Let queued control writes land first, so the snapshot cannot predate
+        # them and briefly revert their optimistic state.
+        await self.async_flush_control()
+        # get_status (re)connects lazily if the AC dropped the socket.
         # Firmware versions are parsed from DeviceState (see _parse_state).
-        return await self.client.get_status()
+        state = await self.client.get_status()
+        if self.data is not None and _controls(state) != _controls(self.data):
+            self._boost_polling()
+        elif (
+            self.update_interval != _DEFAULT_INTERVAL
+            and self.hass.loop.time() >= self._fast_poll_until
+        ):
+            self.update_interval = _DEFAULT_INTERVAL
+        return state
+
+    def _boost_polling(self) -> None:
+        """Poll at FAST_POLL_INTERVAL for the next FAST_POLL_DURATION seconds."""
+        self._fast_poll_until = self.hass.loop.time() + FAST_POLL_DURATION
+        self.update_interval = _FAST_INTERVAL
 
     async def send_command(
         self,
@@ -98,8 +183,8 @@ class Samsung2878Coordinator(DataUpdateCoordinator[Samsung2878State]):
 
         When optimistic is provided, the coordinator data is updated
         immediately so the UI reflects the change without waiting for
-        the next poll. The regular 30s poll will reconcile with the
-        actual AC state.
+        the next poll, which runs FAST_POLL_INTERVAL seconds later and
+        reconciles with the actual AC state.
 
         Like the poll, this absorbs the AC's habit of dropping its idle
         socket between interactions: on a connection error we drop the
@@ -107,7 +192,6 @@ class Samsung2878Coordinator(DataUpdateCoordinator[Samsung2878State]):
         surfacing the failure to the user.
         """
         try:
-            await self.client.ensure_connected()
             await coro_func(*args)
         except Samsung2878AuthError as err:
             await self.client.disconnect()
@@ -116,13 +200,124 @@ class Samsung2878Coordinator(DataUpdateCoordinator[Samsung2878State]):
             _LOGGER.debug("Command failed (%s); reconnecting and retrying once", err)
             await self.client.disconnect()
             try:
-                await self.client.ensure_connected()
                 await coro_func(*args)
             except Samsung2878Error as err2:
                 await self.client.disconnect()
                 raise HomeAssistantError(f"Command failed: {err2}") from err2
 
-        if optimistic and self.data:
-            for key, value in optimistic.items():
-                setattr(self.data, key, value)
-            self.async_set_updated_data(self.data)
+        was_fast = self.update_interval == _FAST_INTERVAL
+        self._boost_polling()
+        if not was_fast and self._unsub_boost_refresh is None:
+            # The already-scheduled poll is still a slow one; poll early
+            # instead. That refresh schedules the next at the new interval.
+            self._unsub_boost_refresh = async_call_later(
+                self.hass, FAST_POLL_INTERVAL, self._async_boost_refresh
+            )
+
+        if optimistic:
+            self.async_set_optimistic(optimistic)
+
+    async def _async_boost_refresh(self, _now: Any) -> None:
+        """Run the early poll scheduled by send_command."""
+        self._unsub_boost_refresh = None
+        await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the pending early poll, then shut down as usual."""
+        if self._unsub_boost_refresh is not None:
+            self._unsub_boost_refresh()
+            self._unsub_boost_refresh = None
+        await super().async_shutdown()
+
+    @callback
+    def async_set_optimistic(self, optimistic: dict[str, Any]) -> None:
+        """Reflect expected state changes locally before the AC confirms them.
+
+        Listeners are only notified if a value differs from the current
+        snapshot. The next poll reconciles with the actual AC state.
+        """
+        if not self.data:
+            return
+        changed = {
+            key: value
+            for key, value in optimistic.items()
+            if getattr(self.data, key) != value
+        }
+        if not changed:
+            # The AC already reports these values; don't wake every entity.
+            return
+        # Swap in a new snapshot rather than mutating the shared one, so
+        # entities must read through ``coordinator.data`` (not cache it).
+        self.async_set_updated_data(replace(self.data, **changed))
+
+    async def async_send_control(
+        self,
+        attrs: dict[str, str],
+        *,
+        optimistic: dict[str, Any] | None = None,
+    ) -> None:
+        """Set AC registers, coalescing callers from the same loop tick.
+
+        Registers queued by several entities or service calls before the event
+        loop gets round to sending them are merged into a single DeviceControl
+        request (e.g. a scene setting mode, fan and swing costs one round-trip
+        instead of three). Later values for the same register win. Every caller
+        awaits the shared request and sees its error, if any.
+        """
+        self._pending_control.update(attrs)
+        if optimistic:
+            self._pending_optimistic.update(optimistic)
+        if self._control_flush is None:
+            self._control_flush = self.hass.loop.create_future()
+            self.hass.loop.call_soon(self._start_control_flush)
+        # Shield so one cancelled caller does not abort the batch for the rest.
+        await asyncio.shield(self._control_flush)
+
+    async def async_flush_control(self) -> None:
+        """Wait until every queued async_send_control batch has been sent.
+
+        Errors are not raised here; each batch's callers already receive them.
+        """
+        pending = set(self._control_sending)
+        if self._control_flush is not None:
+            pending.add(self._control_flush)
+        if pending:
+            await asyncio.wait(pending)
+
+    @callback
+    def _start_control_flush(self) -> None:
+        """Send everything queued by async_send_control during the last tick."""
+        future = self._control_flush
+        self._control_flush = None
+        attrs, self._pending_control = self._pending_control, {}
+        optimistic, self._pending_optimistic = self._pending_optimistic, {}
+        if future is None:
+            return
+        self._control_sending.add(future)
+        future.add_done_callback(self._control_sending.discard)
+        # Every caller may have been cancelled; don't log the error as lost.
+        future.add_done_callback(_consume_exception)
+        self.hass.async_create_task(
+            self._async_flush_control(future, attrs, optimistic)
+        )
+
+    async def _async_flush_control(
+        self,
+        future: asyncio.Future[None],
+        attrs: dict[str, str],
+        optimistic: dict[str, Any],
+    ) -> None:
+        """Send one coalesced DeviceControl and resolve the shared future."""
+        try:
+            await self.send_command(
+                self.client.set_multiple, attrs, optimistic=optimistic or None
+            )
+        except Exception as err:  # noqa: BLE001
+            future.set_exception(err)
+        else:
+            future.set_result(None)
+        finally:
+            if not future.done():
+                # Cancelled (e.g. at unload). Callers, and the polls waiting in
+                # async_flush_control, would otherwise wait forever.
+                future.set_exception(HomeAssistantError("Command cancelled"))
@@ -0,0 +1,112 @@
+"""Base entity for Samsung 2878 AC."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+import logging
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import Samsung2878Coordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Samsung2878Entity(CoordinatorEntity[Samsung2878Coordinator]):
+    """Coordinator entity that writes state only when its own field changes.
+
+    Every poll, push and command notifies all entities, but most of them
+    show a single ``Samsung2878State`` field that rarely moves (firmware
+    versions, capabilities). Subclasses set ``_field`` to that attribute name
+    and skip the state write when neither it nor availability changed.
+    Without ``_field`` the entity writes on every update, as usual.
+
+    Subclasses that set ``_command_cooldown`` can send commands through
+    ``_async_send_debounced``: the optimistic state is shown at once, but
+    only the last command of a burst (a slider drag, an on/off/on toggle) is
+    sent to the AC, once the burst has been quiet for the cooldown.
+    """
+
+    _field: str | None = None
+    _last_written: tuple[bool, Any] | None = None
+
+    _command_cooldown: float | None = None
+    _command_debouncer: Debouncer | None = None
+    _pending_command: (
+        tuple[Callable[..., Coroutine[Any, Any, None]], Any, dict[str, Any]] | None
+    ) = None
+
+    async def async_added_to_hass(self) -> None:
+        """Create the command debouncer once hass is available."""
+        await super().async_added_to_hass()
+        if self._command_cooldown is None:
+            return
+        self._command_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=self._command_cooldown,
+            immediate=False,
+            function=self._async_send_pending_command,
+        )
+        # Cancel any pending send if the entity is removed mid-debounce.
+        self.async_on_remove(self._command_debouncer.async_cancel)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state if the watched field or availability changed."""
+        if self._field is not None:
+            current = (self.available, getattr(self.coordinator.data, self._field))
+            if current == self._last_written:
+                return
+            self._last_written = current
+        super()._handle_coordinator_update()
+
+    async def _async_send_debounced(
+        self,
+        coro_func: Callable[..., Coroutine[Any, Any, None]],
+        value: Any,
+        optimistic: dict[str, Any],
+    ) -> None:
+        """Show ``optimistic`` now and send ``coro_func(value)`` after a pause.
+
+        Does nothing if the AC already reports ``optimistic`` and no other
+        value is waiting to be sent (e.g. turning on a switch that is on).
+        """
+        data = self.coordinator.data
+        if self._pending_command is None and all(
+            getattr(data, key) == new for key, new in optimistic.items()
+        ):
+            return
+        self.coordinator.async_set_optimistic(optimistic)
+        self._pending_command = (coro_func, value, optimistic)
+        if self._command_debouncer is not None:
+            await self._command_debouncer.async_call()
+        else:  # pragma: no cover - debouncer is set in async_added_to_hass
+            await self._async_send_pending_command()
+
+    async def _async_send_pending_command(self) -> None:
+        """Send the most recent debounced command to the AC.
+
+        The debouncer ignores calls while this runs, so values that arrive
+        during a send are picked up here once it finishes. Nobody awaits this
+        call (the debouncer only logs its errors), so if the last send fails
+        the state is refreshed from the AC to replace the optimistic value it
+        never applied.
+        """
+        while (pending := self._pending_command) is not None:
+            self._pending_command = None
+            coro_func, value, optimistic = pending
+            try:
+                await self.coordinator.send_command(
+                    coro_func, value, optimistic=optimistic
+                )
+            except Exception:
+                if self._pending_command is not None:
+                    # A newer value supersedes the failed one; send that.
+                    _LOGGER.debug("Debounced command failed", exc_info=True)
+                    continue
+                await self.coordinator.async_request_refresh()
+                raise
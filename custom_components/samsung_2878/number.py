@@ -8,10 +8,10 @@ from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_MAC, DOMAIN
 from .coordinator import Samsung2878Coordinator
+from .entity import Samsung2878Entity
 
 
 async def async_setup_entry(
@@ -22,20 +22,16 @@ async def async_setup_entry(
     """Set up Samsung 2878 number entities from a config entry."""
     coordinator: Samsung2878Coordinator = hass.data[DOMAIN][entry.entry_id]
     mac = entry.data[CONF_MAC]
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, mac)},
-        name=entry.title,
-        manufacturer="Samsung",
-        model="AC 2878 (AR12HSFSAWKN)",
-    )
+    device_info = coordinator.device_info
     async_add_entities([SleepTimerNumber(coordinator, mac, device_info)])
 
 
-class SleepTimerNumber(
-    CoordinatorEntity[Samsung2878Coordinator], NumberEntity
-):
+class SleepTimerNumber(Samsung2878Entity, NumberEntity):
     """Sleep timer number entity."""
 
+    _field = "sleep_timer"
+    # Coalesce a slider drag into one write of the final value.
+    _command_cooldown = 0.4
     _attr_has_entity_name = True
     _attr_name = "Sleep timer"
     _attr_icon = "mdi:sleep"
@@ -62,7 +58,7 @@ class SleepTimerNumber(
 
     async def async_set_native_value(self, value: float) -> None:
         """Set sleep timer."""
-        await self.coordinator.send_command(
+        await self._async_send_debounced(
             self.coordinator.client.set_sleep_timer, int(value),
-            optimistic={"sleep_timer": int(value)},
+            {"sleep_timer": int(value)},
         )
@@ -8,12 +8,18 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_MAC, DOMAIN
 from .coordinator import Samsung2878Coordinator
+from .entity import Samsung2878Entity
 
 FILTER_TIME_OPTIONS = ["180", "300", "500", "700"]
+# AC register value -> option string, so current_option reuses the option
+# strings instead of formatting the value on every state write. Values outside
+# the options map to None, which HA would report as unknown anyway.
+FILTER_TIME_STR: dict[int, str] = {
+    int(option): option for option in FILTER_TIME_OPTIONS
+}
 
 
 async def async_setup_entry(
@@ -24,20 +30,15 @@ async def async_setup_entry(
     """Set up Samsung 2878 selects from a config entry."""
     coordinator: Samsung2878Coordinator = hass.data[DOMAIN][entry.entry_id]
     mac = entry.data[CONF_MAC]
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, mac)},
-        name=entry.title,
-        manufacturer="Samsung",
-        model="AC 2878 (AR12HSFSAWKN)",
-    )
+    device_info = coordinator.device_info
     async_add_entities([FilterTimeSelect(coordinator, mac, device_info)])
 
 
-class FilterTimeSelect(
-    CoordinatorEntity[Samsung2878Coordinator], SelectEntity
-):
+class FilterTimeSelect(Samsung2878Entity, SelectEntity):
     """Filter replacement threshold select."""
 
+    _field = "filter_time"
+    _command_cooldown = 0.1
     _attr_has_entity_name = True
     _attr_name = "Filter threshold"
     _attr_icon = "mdi:air-filter"
@@ -57,14 +58,11 @@ class FilterTimeSelect(
     @property
     def current_option(self) -> str | None:
         """Return the current filter time threshold."""
-        val = self.coordinator.data.filter_time
-        if val is not None:
-            return str(val)
-        return None
+        return FILTER_TIME_STR.get(self.coordinator.data.filter_time)
 
     async def async_select_option(self, option: str) -> None:
         """Change the filter time threshold."""
-        await self.coordinator.send_command(
+        await self._async_send_debounced(
             self.coordinator.client.set_filter_time, int(option),
-            optimistic={"filter_time": int(option)},
+            {"filter_time": int(option)},
         )
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -15,13 +20,113 @@ from homeassistant.const import (
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.typing import StateType
 
 from .const import CONF_MAC, DOMAIN
 from .coordinator import Samsung2878Coordinator
+from .entity import Samsung2878Entity
+
+
+@dataclass(frozen=True, kw_only=True)
+class Samsung2878SensorEntityDescription(SensorEntityDescription):
+    """Sensor showing one ``Samsung2878State`` field.
+
+    ``key`` is the unique_id suffix; ``field`` is the state attribute read.
+    """
+
+    field: str
+    value_fn: Callable[[Any], StateType] = lambda value: value
+
+
+SENSORS: tuple[Samsung2878SensorEntityDescription, ...] = (
+    Samsung2878SensorEntityDescription(
+        key="outdoor_temp",
+        field="outdoor_temp",
+        name="Outdoor temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    Samsung2878SensorEntityDescription(
+        key="error",
+        field="error",
+        name="Error status",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:alert-circle-outline",
+        value_fn=lambda error: error or "OK",
+    ),
+    # Instantaneous power draw (AC_ADD2_USEDWATT, watts), not cumulative
+    # energy; lifetime energy is "used_power" below.
+    Samsung2878SensorEntityDescription(
+        key="power",
+        field="used_watt",
+        name="Power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+    ),
+    Samsung2878SensorEntityDescription(
+        key="filter_usage",
+        field="filter_use_time",
+        name="Filter usage",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        icon="mdi:air-filter",
+    ),
+    Samsung2878SensorEntityDescription(
+        key="used_power",
+        field="used_power",
+        name="Lifetime energy",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    Samsung2878SensorEntityDescription(
+        key="used_time",
+        field="used_time",
+        name="Operating time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    Samsung2878SensorEntityDescription(
+        key="cool_capability",
+        field="cool_capability",
+        name="Cooling capability",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:snowflake",
+    ),
+    Samsung2878SensorEntityDescription(
+        key="warm_capability",
+        field="warm_capability",
+        name="Heating capability",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:fire",
+    ),
+    Samsung2878SensorEntityDescription(
+        key="panel_version",
+        field="panel_version",
+        name="Panel version",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:chip",
+    ),
+    Samsung2878SensorEntityDescription(
+        key="outdoor_version",
+        field="outdoor_version",
+        name="Outdoor unit version",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:chip",
+    ),
+)
 
 
 async def async_setup_entry(
@@ -32,302 +137,39 @@ async def async_setup_entry(
     """Set up Samsung 2878 sensors from a config entry."""
     coordinator: Samsung2878Coordinator = hass.data[DOMAIN][entry.entry_id]
     mac = entry.data[CONF_MAC]
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, mac)},
-        name=entry.title,
-        manufacturer="Samsung",
-        model="AC 2878 (AR12HSFSAWKN)",
-    )
-    # ErrorSensor is always present; every other sensor is created only when the
-    # device actually reports that register, so unsupported values (which the AC
-    # returns as sentinels and the client parses to None) never appear in HA.
+    # A sensor is created only when the device actually reports its register,
+    # so unsupported values (which the AC returns as sentinels and the client
+    # parses to None) never appear in HA. The error field is never None, so
+    # the error sensor is always present.
     data = coordinator.data
-    entities: list[SensorEntity] = [ErrorSensor(coordinator, mac, device_info)]
-    optional: list[tuple[type[SensorEntity], object]] = [
-        (OutdoorTemperatureSensor, data.outdoor_temp),
-        (PowerSensor, data.used_watt),
-        (FilterUsageSensor, data.filter_use_time),
-        (UsedPowerSensor, data.used_power),
-        (UsedTimeSensor, data.used_time),
-        (CoolCapabilitySensor, data.cool_capability),
-        (WarmCapabilitySensor, data.warm_capability),
-        (PanelVersionSensor, data.panel_version),
-        (OutdoorVersionSensor, data.outdoor_version),
-    ]
-    entities.extend(
-        cls(coordinator, mac, device_info)
-        for cls, value in optional
-        if value is not None
+    async_add_entities(
+        Samsung2878Sensor(coordinator, mac, description)
+        for description in SENSORS
+        if getattr(data, description.field) is not None
     )
-    async_add_entities(entities)
-
-
-class OutdoorTemperatureSensor(
-    CoordinatorEntity[Samsung2878Coordinator], SensorEntity
-):
-    """Outdoor temperature sensor."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Outdoor temperature"
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-
-    def __init__(
-        self,
-        coordinator: Samsung2878Coordinator,
-        mac: str,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_outdoor_temp"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self) -> float | None:
-        """Return outdoor temperature."""
-        return self.coordinator.data.outdoor_temp
-
-
-class ErrorSensor(CoordinatorEntity[Samsung2878Coordinator], SensorEntity):
-    """AC error status sensor."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Error status"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_icon = "mdi:alert-circle-outline"
-
-    def __init__(
-        self,
-        coordinator: Samsung2878Coordinator,
-        mac: str,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_error"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self) -> str:
-        """Return error code or OK."""
-        return self.coordinator.data.error or "OK"
-
-
-class PowerSensor(
-    CoordinatorEntity[Samsung2878Coordinator], SensorEntity
-):
-    """Instantaneous power draw sensor (AC_ADD2_USEDWATT, watts).
-
-    This is a live power measurement, not cumulative energy. For lifetime
-    energy (kWh) use UsedPowerSensor. Models without a power meter report a
-    sentinel value, in which case this entity is not created.
-    """
-
-    _attr_has_entity_name = True
-    _attr_name = "Power"
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-
-    def __init__(
-        self,
-        coordinator: Samsung2878Coordinator,
-        mac: str,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_power"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self) -> int | None:
-        """Return instantaneous power draw in watts."""
-        return self.coordinator.data.used_watt
-
-
-class FilterUsageSensor(
-    CoordinatorEntity[Samsung2878Coordinator], SensorEntity
-):
-    """Filter usage time sensor."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Filter usage"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfTime.HOURS
-    _attr_icon = "mdi:air-filter"
-
-    def __init__(
-        self,
-        coordinator: Samsung2878Coordinator,
-        mac: str,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_filter_usage"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self) -> int | None:
-        """Return filter usage in hours."""
-        return self.coordinator.data.filter_use_time
-
-
-class UsedPowerSensor(CoordinatorEntity[Samsung2878Coordinator], SensorEntity):
-    """Lifetime power usage sensor."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Lifetime energy"
-    _attr_device_class = SensorDeviceClass.ENERGY
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        coordinator: Samsung2878Coordinator,
-        mac: str,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_used_power"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self) -> float | None:
-        """Return lifetime energy usage in kWh."""
-        return self.coordinator.data.used_power
-
-
-class UsedTimeSensor(CoordinatorEntity[Samsung2878Coordinator], SensorEntity):
-    """Lifetime operating time sensor."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Operating time"
-    _attr_device_class = SensorDeviceClass.DURATION
-    _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfTime.HOURS
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    def __init__(
-        self,
-        coordinator: Samsung2878Coordinator,
-        mac: str,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_used_time"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self) -> float | None:
-        """Return operating time in hours."""
-        return self.coordinator.data.used_time
-
-
-class CoolCapabilitySensor(
-    CoordinatorEntity[Samsung2878Coordinator], SensorEntity
-):
-    """Cooling capability sensor."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Cooling capability"
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_icon = "mdi:snowflake"
-
-    def __init__(
-        self,
-        coordinator: Samsung2878Coordinator,
-        mac: str,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_cool_capability"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self) -> float | None:
-        """Return rated cooling capability in kW."""
-        return self.coordinator.data.cool_capability
-
-
-class WarmCapabilitySensor(
-    CoordinatorEntity[Samsung2878Coordinator], SensorEntity
-):
-    """Heating capability sensor."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Heating capability"
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_icon = "mdi:fire"
-
-    def __init__(
-        self,
-        coordinator: Samsung2878Coordinator,
-        mac: str,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_warm_capability"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self) -> float | None:
-        """Return rated heating capability in kW."""
-        return self.coordinator.data.warm_capability
-
-
-class PanelVersionSensor(
-    CoordinatorEntity[Samsung2878Coordinator], SensorEntity
-):
-    """Panel firmware version sensor."""
-
-    _attr_has_entity_name = True
-    _attr_name = "Panel version"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_icon = "mdi:chip"
-
-    def __init__(
-        self,
-        coordinator: Samsung2878Coordinator,
-        mac: str,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_panel_version"
-        self._attr_device_info = device_info
-
-    @property
-    def native_value(self) -> str | None:
-        """Return panel firmware version."""
-        return self.coordinator.data.panel_version
 
 
-class OutdoorVersionSensor(
-    CoordinatorEntity[Samsung2878Coordinator], SensorEntity
-):
-    """Outdoor unit firmware version sensor."""
+class Samsung2878Sensor(Samsung2878Entity, SensorEntity):
+    """Samsung 2878 AC sensor."""
 
+    entity_description: Samsung2878SensorEntityDescription
     _attr_has_entity_name = True
-    _attr_name = "Outdoor unit version"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_icon = "mdi:chip"
 
     def __init__(
         self,
         coordinator: Samsung2878Coordinator,
         mac: str,
-        device_info: DeviceInfo,
+        description: Samsung2878SensorEntityDescription,
     ) -> None:
         super().__init__(coordinator)
-        self._attr_unique_id = f"{mac}_outdoor_version"
-        self._attr_device_info = device_info
+        self.entity_description = description
+        self._field = description.field
+        self._attr_unique_id = f"{mac}_{description.key}"
+        self._attr_device_info = coordinator.device_info
 
     @property
-    def native_value(self) -> str | None:
-        """Return outdoor unit firmware version."""
-        return self.coordinator.data.outdoor_version
+    def native_value(self) -> StateType:
+        """Return the sensor value."""
+        return self.entity_description.value_fn(
+            getattr(self.coordinator.data, self._field)
+        )
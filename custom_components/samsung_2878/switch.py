@@ -9,10 +9,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_MAC, DOMAIN
 from .coordinator import Samsung2878Coordinator
+from .entity import Samsung2878Entity
 
 
 async def async_setup_entry(
@@ -23,23 +23,19 @@ async def async_setup_entry(
     """Set up Samsung 2878 switches from a config entry."""
     coordinator: Samsung2878Coordinator = hass.data[DOMAIN][entry.entry_id]
     mac = entry.data[CONF_MAC]
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, mac)},
-        name=entry.title,
-        manufacturer="Samsung",
-        model="AC 2878 (AR12HSFSAWKN)",
-    )
+    device_info = coordinator.device_info
     async_add_entities([
         AutoCleanSwitch(coordinator, mac, device_info),
         SPISwitch(coordinator, mac, device_info),
     ])
 
 
-class AutoCleanSwitch(
-    CoordinatorEntity[Samsung2878Coordinator], SwitchEntity
-):
+class AutoCleanSwitch(Samsung2878Entity, SwitchEntity):
     """Auto clean switch."""
 
+    _field = "auto_clean"
+    # Coalesce quick on/off/on toggles into one write of the final state.
+    _command_cooldown = 0.1
     _attr_has_entity_name = True
     _attr_name = "Auto clean"
     _attr_icon = "mdi:shimmer"
@@ -61,22 +57,21 @@ class AutoCleanSwitch(
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on auto clean."""
-        await self.coordinator.send_command(
-            self.coordinator.client.set_auto_clean, True,
-            optimistic={"auto_clean": True},
+        await self._async_send_debounced(
+            self.coordinator.client.set_auto_clean, True, {"auto_clean": True},
         )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off auto clean."""
-        await self.coordinator.send_command(
-            self.coordinator.client.set_auto_clean, False,
-            optimistic={"auto_clean": False},
+        await self._async_send_debounced(
+            self.coordinator.client.set_auto_clean, False, {"auto_clean": False},
         )
 
 
-class SPISwitch(CoordinatorEntity[Samsung2878Coordinator], SwitchEntity):
+class SPISwitch(Samsung2878Entity, SwitchEntity):
     """SPI (ionizer) switch."""
 
+    _field = "spi"
     _attr_has_entity_name = True
     _attr_name = "Ionizer"
     _attr_icon = "mdi:air-purifier"
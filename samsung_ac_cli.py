@@ -7,41 +7,150 @@ Uses the same client as the HACS integration.
 from __future__ import annotations
 
 import argparse
-import asyncio
+import functools
 import json
 import os
+import socket
 import sys
-from dataclasses import asdict
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-# Import client directly to avoid triggering __init__.py (which needs homeassistant)
-import importlib.util
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used instead
+    orjson = None
 
-_client_path = str(Path(__file__).parent / "custom_components" / "samsung_2878" / "client.py")
-_spec = importlib.util.spec_from_file_location("samsung_2878_client", _client_path)
-_client_mod = importlib.util.module_from_spec(_spec)
-_client_mod.__package__ = "samsung_2878_client"
-sys.modules[_spec.name] = _client_mod
-_spec.loader.exec_module(_client_mod)
+if TYPE_CHECKING:
+    import asyncio
 
-Samsung2878Client = _client_mod.Samsung2878Client
-Samsung2878State = _client_mod.Samsung2878State
+    from custom_components.samsung_2878.client import (
+        Samsung2878Client,
+        Samsung2878State,
+    )
 
 CONFIG_DIR = Path.home() / ".config" / "samsung-ac"
 CONFIG_FILE = CONFIG_DIR / "config.json"
+# While `daemon` runs, other invocations forward their command over this socket
+# instead of opening their own connection to the AC.
+DAEMON_SOCKET = CONFIG_DIR / "daemon.sock"
+# How long a forwarded command may take before the CLI gives up on the daemon.
+_DAEMON_TIMEOUT = 120
+
+# Spellings accepted as "on" for the on/off toggle commands.
+_TRUTHY = frozenset({"on", "true", "1"})
+
+# Argument choices, built once rather than on every build_parser() call.
+_MODES = ("Auto", "Cool", "Heat", "Dry", "Wind")
+_FAN_MODES = ("Auto", "Low", "Mid", "High", "Turbo")
+_SWING_MODES = (
+    "Off", "Fixed", "SwingUD", "SwingLR", "Rotation",
+    "Indirect", "Direct", "Center", "Wide", "Left", "Right", "Long",
+)
+_PRESETS = ("Off", "Quiet", "Sleep", "Smart", "SoftCool")
+_ON_OFF = ("on", "off")
+_POWER_LOG_UNITS = ("Hour", "Day")
+_TEMP_MIN = 16
+_TEMP_MAX = 30
+
+
+def _temperature(value: str) -> int:
+    """Parse a target temperature argument, checking the supported range."""
+    try:
+        temp = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a whole number: {value!r}") from None
+    if not _TEMP_MIN <= temp <= _TEMP_MAX:
+        raise argparse.ArgumentTypeError(
+            f"{temp} is outside {_TEMP_MIN}-{_TEMP_MAX} °C"
+        )
+    return temp
+
+
+def _positive_int(value: str) -> int:
+    """Parse a count argument that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a whole number: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+@functools.cache
+def _client_module() -> ModuleType:
+    """Import custom_components.samsung_2878.client on first use.
+
+    Only when a command talks to the AC, so `configure` and `--help` start
+    without asyncio and ssl. The integration package is registered as a bare
+    package first so its __init__.py (which needs homeassistant) never runs;
+    client.py itself then goes through the normal import system, which also
+    finds it inside a zipapp.
+    """
+    import importlib
+
+    package = "custom_components.samsung_2878"
+    if package not in sys.modules:
+        stub = ModuleType(package)
+        package_dir = Path(__file__).parent / "custom_components" / "samsung_2878"
+        stub.__path__ = [str(package_dir)]
+        sys.modules[package] = stub
+    return importlib.import_module(f"{package}.client")
+
+
+# (st_mtime_ns, parsed config) of the last CONFIG_FILE read.
+_config_cache: tuple[int, dict[str, str]] | None = None
 
 
 def load_config() -> dict[str, str]:
-    """Load saved config from disk."""
-    if CONFIG_FILE.exists():
-        return json.loads(CONFIG_FILE.read_text())
-    return {}
+    """Load saved config from disk.
+
+    The parsed file is cached and only re-read when its mtime changes, so
+    repeated lookups (batch, daemon) cost a stat() instead of a read+parse.
+    """
+    global _config_cache  # noqa: PLW0603
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if _config_cache is None or _config_cache[0] != mtime:
+        data = CONFIG_FILE.read_bytes()
+        cfg = orjson.loads(data) if orjson is not None else json.loads(data)
+        _config_cache = (mtime, cfg)
+    # A copy, so callers such as `configure` can edit it freely.
+    return dict(_config_cache[1])
 
 
 def save_config(cfg: dict[str, str]) -> None:
     """Save config to disk."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(cfg, indent=2) + "\n")
+    if orjson is not None:
+        CONFIG_FILE.write_bytes(orjson.dumps(cfg, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        CONFIG_FILE.write_text(json.dumps(cfg, indent=2) + "\n")
+
+
+def print_json(obj: object) -> None:
+    """Print ``obj`` (dataclasses, dicts and lists) as indented JSON.
+
+    With orjson the encoded bytes go straight to stdout's buffer, skipping
+    the text layer; dataclasses are serialized natively, without asdict.
+    """
+    if orjson is None:
+        from dataclasses import asdict
+
+        print(json.dumps(obj, indent=2, default=asdict))
+        return
+    data = orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # e.g. captured by the daemon
+        sys.stdout.write(data.decode())
+        return
+    # Keep ordering with text already printed (batch mode).
+    sys.stdout.flush()
+    buffer.write(data)
 
 
 def resolve_config(args: argparse.Namespace) -> tuple[str, str, str]:
@@ -70,63 +179,81 @@ def resolve_config(args: argparse.Namespace) -> tuple[str, str, str]:
     return host, token, mac
 
 
+# MAC address -> DUID in one pass: drop separators, upper-case the hex digits.
+_MAC_TRANSLATE = str.maketrans("abcdef", "ABCDEF", ":-")
+
+
 async def connect_client(host: str, token: str, mac: str) -> Samsung2878Client:
-    """Create, connect, and authenticate a client."""
-    duid = mac.upper().replace(":", "").replace("-", "")
-    client = Samsung2878Client(host=host, port=2878, token=token, duid=duid)
-    await client.connect()
-    await client.authenticate()
+    """Create, connect, and authenticate a client.
+
+    The socket is closed again if connecting or authenticating fails.
+    """
+    duid = mac.translate(_MAC_TRANSLATE)
+    client = _client_module().Samsung2878Client(
+        host=host, port=2878, token=token, duid=duid
+    )
+    ready = False
+    try:
+        await client.connect()
+        await client.authenticate()
+        ready = True
+    finally:
+        if not ready:
+            await client.disconnect()
     return client
 
 
+# Rows of the status table: (label, state attribute, unit suffix, optional).
+# Optional rows are left out while the AC does not report the value (None, or
+# an empty string for the text fields); booleans print as On/Off.
+_STATE_ROWS: tuple[tuple[str, str, str, bool], ...] = (
+    ("Power", "power", "", False),
+    ("Mode", "mode", "", False),
+    ("Current temp", "current_temp", " °C", False),
+    ("Target temp", "target_temp", " °C", False),
+    ("Fan mode", "fan_mode", "", False),
+    ("Swing mode", "swing_mode", "", False),
+    ("Preset", "preset", "", False),
+    ("Outdoor temp", "outdoor_temp", " °C", True),
+    ("Error", "error", "", True),
+    ("Auto clean", "auto_clean", "", False),
+    ("Ionizer (SPI)", "spi", "", False),
+    ("Sleep timer", "sleep_timer", " min", False),
+    ("Power draw", "used_watt", " W", True),
+    ("Lifetime energy", "used_power", " kWh", True),
+    ("Operating time", "used_time", " h", True),
+    ("Filter usage", "filter_use_time", " h", True),
+    ("Filter threshold", "filter_time", " h", True),
+    ("Cool capability", "cool_capability", " kW", True),
+    ("Warm capability", "warm_capability", " kW", True),
+    ("Panel version", "panel_version", "", True),
+    ("Outdoor version", "outdoor_version", "", True),
+)
+
+# Registers already shown by _STATE_ROWS; the rest are listed raw.
+_KNOWN_KEYS: frozenset[str] = frozenset({
+    "AC_FUN_POWER", "AC_FUN_OPMODE", "AC_FUN_TEMPNOW", "AC_FUN_TEMPSET",
+    "AC_FUN_WINDLEVEL", "AC_FUN_DIRECTION", "AC_FUN_COMODE", "AC_FUN_ERROR",
+    "AC_FUN_SLEEP", "AC_ADD_AUTOCLEAN", "AC_ADD_SPI", "AC_ADD2_USEDWATT",
+    "AC_ADD2_USEDPOWER", "AC_ADD2_USEDTIME", "AC_ADD2_FILTER_USE_TIME",
+    "AC_ADD2_FILTERTIME", "AC_OUTDOOR_TEMP", "AC_COOL_CAPABILITY",
+    "AC_WARM_CAPABILITY", "AC_ADD2_PANEL_VERSION", "AC_ADD2_OUT_VERSION",
+})
+
+
 def format_state_table(state: Samsung2878State) -> str:
     """Format state as a readable table."""
-    raw = state.raw
-    lines = [
-        f"{'Power':<24} {'On' if state.power else 'Off'}",
-        f"{'Mode':<24} {state.mode}",
-        f"{'Current temp':<24} {state.current_temp} °C",
-        f"{'Target temp':<24} {state.target_temp} °C",
-        f"{'Fan mode':<24} {state.fan_mode}",
-        f"{'Swing mode':<24} {state.swing_mode}",
-        f"{'Preset':<24} {state.preset}",
-    ]
-    if state.outdoor_temp is not None:
-        lines.append(f"{'Outdoor temp':<24} {state.outdoor_temp} °C")
-    if state.error:
-        lines.append(f"{'Error':<24} {state.error}")
-    lines.append(f"{'Auto clean':<24} {'On' if state.auto_clean else 'Off'}")
-    lines.append(f"{'Ionizer (SPI)':<24} {'On' if state.spi else 'Off'}")
-    lines.append(f"{'Sleep timer':<24} {state.sleep_timer} min")
-    if state.used_watt is not None:
-        lines.append(f"{'Power draw':<24} {state.used_watt} W")
-    if state.used_power is not None:
-        lines.append(f"{'Lifetime energy':<24} {state.used_power} kWh")
-    if state.used_time is not None:
-        lines.append(f"{'Operating time':<24} {state.used_time} h")
-    if state.filter_use_time is not None:
-        lines.append(f"{'Filter usage':<24} {state.filter_use_time} h")
-    if state.filter_time is not None:
-        lines.append(f"{'Filter threshold':<24} {state.filter_time} h")
-    if state.cool_capability is not None:
-        lines.append(f"{'Cool capability':<24} {state.cool_capability} kW")
-    if state.warm_capability is not None:
-        lines.append(f"{'Warm capability':<24} {state.warm_capability} kW")
-    if state.panel_version:
-        lines.append(f"{'Panel version':<24} {state.panel_version}")
-    if state.outdoor_version:
-        lines.append(f"{'Outdoor version':<24} {state.outdoor_version}")
+    lines = []
+    for label, attr, unit, optional in _STATE_ROWS:
+        value = getattr(state, attr)
+        if optional and (value is None or value == ""):
+            continue
+        if value is True or value is False:
+            value = "On" if value else "Off"
+        lines.append(f"{label:<24} {value}{unit}")
 
     # Show any raw attributes not already displayed
-    known_keys = {
-        "AC_FUN_POWER", "AC_FUN_OPMODE", "AC_FUN_TEMPNOW", "AC_FUN_TEMPSET",
-        "AC_FUN_WINDLEVEL", "AC_FUN_DIRECTION", "AC_FUN_COMODE", "AC_FUN_ERROR",
-        "AC_FUN_SLEEP", "AC_ADD_AUTOCLEAN", "AC_ADD_SPI", "AC_ADD2_USEDWATT",
-        "AC_ADD2_USEDPOWER", "AC_ADD2_USEDTIME", "AC_ADD2_FILTER_USE_TIME",
-        "AC_ADD2_FILTERTIME", "AC_OUTDOOR_TEMP", "AC_COOL_CAPABILITY",
-        "AC_WARM_CAPABILITY", "AC_ADD2_PANEL_VERSION", "AC_ADD2_OUT_VERSION",
-    }
-    extra = {k: v for k, v in raw.items() if k not in known_keys}
+    extra = {k: v for k, v in state.raw.items() if k not in _KNOWN_KEYS}
     if extra:
         lines.append("")
         lines.append("--- Raw attributes ---")
@@ -137,203 +264,406 @@ def format_state_table(state: Samsung2878State) -> str:
 
 
 # --- Command handlers ---
+#
+# Each operation is a ``_do_<op>(client, args)`` coroutine that runs against an
+# already connected client, so a single command and a batch share one
+# implementation; only the connection handling differs.
 
-async def cmd_status(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        state = await client.get_status()
-        if args.json:
-            d = asdict(state)
-            print(json.dumps(d, indent=2))
-        else:
-            print(format_state_table(state))
-    finally:
-        await client.disconnect()
+OpHandler = Callable[["Samsung2878Client", argparse.Namespace], Awaitable[None]]
 
 
-async def cmd_on(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        await client.set_power(True)
-        print("Power: On")
-    finally:
-        await client.disconnect()
+async def _do_status(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    state = await client.get_status()
+    if args.json:
+        print_json(state)
+    else:
+        print(format_state_table(state))
 
 
-async def cmd_off(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        await client.set_power(False)
-        print("Power: Off")
-    finally:
-        await client.disconnect()
+async def _do_on(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    await client.set_power(True)
+    print("Power: On")
 
 
-async def cmd_mode(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        await client.set_mode(args.value)
-        print(f"Mode: {args.value}")
-    finally:
-        await client.disconnect()
+async def _do_off(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    await client.set_power(False)
+    print("Power: Off")
 
 
-async def cmd_temp(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        await client.set_temperature(args.value)
-        print(f"Temperature: {args.value} °C")
-    finally:
-        await client.disconnect()
+async def _do_mode(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    await client.set_mode(args.value)
+    print(f"Mode: {args.value}")
 
 
-async def cmd_fan(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        await client.set_fan_mode(args.value)
-        print(f"Fan: {args.value}")
-    finally:
-        await client.disconnect()
+async def _do_temp(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    await client.set_temperature(args.value)
+    print(f"Temperature: {args.value} °C")
 
 
-async def cmd_swing(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        await client.set_swing_mode(args.value)
-        print(f"Swing: {args.value}")
-    finally:
-        await client.disconnect()
+async def _do_fan(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    await client.set_fan_mode(args.value)
+    print(f"Fan: {args.value}")
 
 
-async def cmd_preset(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        await client.set_preset(args.value)
-        print(f"Preset: {args.value}")
-    finally:
-        await client.disconnect()
+async def _do_swing(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    await client.set_swing_mode(args.value)
+    print(f"Swing: {args.value}")
 
 
-async def cmd_autoclean(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        on = args.state.lower() in ("on", "true", "1")
-        await client.set_auto_clean(on)
-        print(f"Auto clean: {'On' if on else 'Off'}")
-    finally:
-        await client.disconnect()
+async def _do_preset(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    await client.set_preset(args.value)
+    print(f"Preset: {args.value}")
 
 
-async def cmd_spi(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        on = args.state.lower() in ("on", "true", "1")
-        await client.set_spi(on)
-        print(f"Ionizer (SPI): {'On' if on else 'Off'}")
-    finally:
-        await client.disconnect()
+async def _do_autoclean(
+    client: Samsung2878Client, args: argparse.Namespace
+) -> None:
+    on = args.state.lower() in _TRUTHY
+    await client.set_auto_clean(on)
+    print(f"Auto clean: {'On' if on else 'Off'}")
 
 
-async def cmd_sleep(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        await client.set_sleep_timer(args.minutes)
-        if args.minutes == 0:
-            print("Sleep timer: Off")
-        else:
-            print(f"Sleep timer: {args.minutes} min")
-    finally:
-        await client.disconnect()
+async def _do_spi(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    on = args.state.lower() in _TRUTHY
+    await client.set_spi(on)
+    print(f"Ionizer (SPI): {'On' if on else 'Off'}")
 
 
-async def cmd_info(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        info = await client.get_sw_info()
-        if args.json:
-            print(json.dumps(info, indent=2))
-        else:
-            for k, v in info.items():
-                print(f"{k:<24} {v}")
-    finally:
-        await client.disconnect()
+async def _do_sleep(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    await client.set_sleep_timer(args.minutes)
+    if args.minutes == 0:
+        print("Sleep timer: Off")
+    else:
+        print(f"Sleep timer: {args.minutes} min")
 
 
-async def cmd_power_log(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
-    try:
-        entries = await client.get_power_usage(
-            args.date_from, args.date_to, args.unit
-        )
-        if args.json:
-            print(json.dumps(entries, indent=2))
-        else:
-            if not entries:
-                print("No power usage data.")
-            else:
-                print(f"{'Date':<16} {'Usage':<12} {'Time':<8}")
-                print("-" * 36)
-                for e in entries:
-                    print(
-                        f"{e.get('date', '?'):<16} "
-                        f"{e.get('usage', '?'):<12} "
-                        f"{e.get('time', '?'):<8}"
-                    )
-    finally:
-        await client.disconnect()
+async def _do_info(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    info = await client.get_sw_info()
+    if args.json:
+        print_json(info)
+    elif info:
+        print("\n".join(f"{k:<24} {v}" for k, v in info.items()))
 
 
-async def cmd_power_log_enable(args: argparse.Namespace) -> None:
+async def _do_power_log(
+    client: Samsung2878Client, args: argparse.Namespace
+) -> None:
+    entries = await client.get_power_usage(args.date_from, args.date_to, args.unit)
+    if args.json:
+        print_json(entries)
+    else:
+        if not entries:
+            print("No power usage data.")
+        else:
+            # One write for the whole table; histories can run to hundreds
+            # of rows.
+            lines = [f"{'Date':<16} {'Usage':<12} {'Time':<8}", "-" * 36]
+            lines.extend(
+                f"{e.get('date', '?'):<16} "
+                f"{e.get('usage', '?'):<12} "
+                f"{e.get('time', '?'):<8}"
+                for e in entries
+            )
+            print("\n".join(lines))
+
+
+async def _do_power_log_enable(
+    client: Samsung2878Client, args: argparse.Namespace
+) -> None:
+    await client.set_power_logging_mode(True)
+    print("Power logging: Enabled")
+
+
+async def _do_power_log_disable(
+    client: Samsung2878Client, args: argparse.Namespace
+) -> None:
+    await client.set_power_logging_mode(False)
+    print("Power logging: Disabled")
+
+
+async def _do_power_log_reset(
+    client: Samsung2878Client, args: argparse.Namespace
+) -> None:
+    await client.reset_power_logging()
+    print("Power logging data reset.")
+
+
+async def _do_raw(client: Samsung2878Client, args: argparse.Namespace) -> None:
+    response = await client.send_raw_xml(args.xml)
+    print(response)
+
+
+# Subcommand name -> operation, for every command that talks to the AC.
+OPS: dict[str, OpHandler] = {
+    "status": _do_status,
+    "on": _do_on,
+    "off": _do_off,
+    "mode": _do_mode,
+    "temp": _do_temp,
+    "fan": _do_fan,
+    "swing": _do_swing,
+    "preset": _do_preset,
+    "autoclean": _do_autoclean,
+    "spi": _do_spi,
+    "sleep": _do_sleep,
+    "info": _do_info,
+    "power-log": _do_power_log,
+    "power-log-enable": _do_power_log_enable,
+    "power-log-disable": _do_power_log_disable,
+    "power-log-reset": _do_power_log_reset,
+    "raw": _do_raw,
+}
+
+
+async def cmd_single(args: argparse.Namespace, op: OpHandler) -> None:
+    """Run one operation on its own connection."""
     host, token, mac = resolve_config(args)
     client = await connect_client(host, token, mac)
     try:
-        await client.set_power_logging_mode(True)
-        print("Power logging: Enabled")
+        await op(client, args)
     finally:
         await client.disconnect()
 
 
-async def cmd_power_log_disable(args: argparse.Namespace) -> None:
+def parse_batch_ops(args: argparse.Namespace) -> list[argparse.Namespace]:
+    """Turn ``--op``/``--file`` entries into parsed command namespaces.
+
+    Each entry is ``name`` or ``name=value`` (e.g. ``mode=Cool``), parsed by
+    the same subcommand definitions as a single command, so values are
+    validated before anything is sent. A ``--file`` holds a JSON list of such
+    strings.
+    """
+    entries: list[str] = []
+    if args.file:
+        loaded = json.loads(Path(args.file).read_text())
+        if not isinstance(loaded, list) or not all(
+            isinstance(e, str) for e in loaded
+        ):
+            raise ValueError(f"{args.file}: expected a JSON list of strings")
+        entries.extend(loaded)
+    entries.extend(args.op or ())
+    if not entries:
+        raise ValueError("batch: no operations given (use --op or --file)")
+
+    parser = build_parser()
+    parsed = []
+    for entry in entries:
+        name, sep, value = entry.partition("=")
+        if name not in OPS:
+            raise ValueError(f"batch: unknown operation {name!r}")
+        op_args = parser.parse_args([name, value] if sep else [name])
+        op_args.json = args.json
+        parsed.append(op_args)
+    return parsed
+
+
+async def cmd_batch(args: argparse.Namespace) -> None:
+    """Run several operations in order over a single connection."""
+    ops = parse_batch_ops(args)
     host, token, mac = resolve_config(args)
     client = await connect_client(host, token, mac)
     try:
-        await client.set_power_logging_mode(False)
-        print("Power logging: Disabled")
+        for op_args in ops:
+            await OPS[op_args.command](client, op_args)
     finally:
         await client.disconnect()
 
 
-async def cmd_power_log_reset(args: argparse.Namespace) -> None:
+async def _status_one(
+    device: dict[str, str], semaphore: asyncio.Semaphore
+) -> Samsung2878State:
+    """Fetch one device's state on its own connection."""
+    async with semaphore:
+        client = await connect_client(device["host"], device["token"], device["mac"])
+        try:
+            return await client.get_status()
+        finally:
+            await client.disconnect()
+
+
+async def cmd_status_all(args: argparse.Namespace) -> None:
+    """Show the state of several ACs, queried concurrently.
+
+    The devices file is a JSON list of ``{"host", "token", "mac"}`` objects,
+    each optionally with a ``"name"`` used as its heading. Wall time is that
+    of the slowest device rather than the sum; ``--max-concurrent`` caps how
+    many connections are open at once.
+    """
+    import asyncio
+
+    devices = json.loads(Path(args.config).read_text())
+    if not isinstance(devices, list) or not all(
+        isinstance(d, dict) and {"host", "token", "mac"} <= d.keys()
+        for d in devices
+    ):
+        raise ValueError(
+            f"{args.config}: expected a JSON list of objects with host, token, mac"
+        )
+
+    semaphore = asyncio.Semaphore(args.max_concurrent)
+    results = await asyncio.gather(
+        *(_status_one(device, semaphore) for device in devices),
+        return_exceptions=True,
+    )
+
+    failed = 0
+    if args.json:
+        report = []
+        for device, result in zip(devices, results):
+            entry = {"name": device.get("name", device["host"])}
+            if isinstance(result, BaseException):
+                failed += 1
+                entry["error"] = str(result)
+            else:
+                entry["state"] = result
+            report.append(entry)
+        print_json(report)
+    else:
+        blocks = []
+        for device, result in zip(devices, results):
+            if isinstance(result, BaseException):
+                failed += 1
+                body = f"Error: {result}"
+            else:
+                body = format_state_table(result)
+            blocks.append(f"== {device.get('name', device['host'])} ==\n{body}")
+        print("\n\n".join(blocks))
+    if failed:
+        raise RuntimeError(f"{failed} of {len(devices)} devices failed")
+
+
+async def cmd_daemon(args: argparse.Namespace) -> None:
+    """Keep one AC connection open and serve commands over DAEMON_SOCKET.
+
+    Each request is one JSON line ``{"argv": [...], "host": ..., "mac": ...}``
+    holding the command line of a regular invocation and the AC it resolved
+    to; the reply is one JSON line with ``ok``, the command's ``output`` and,
+    on failure, ``error``. Requests for a different AC are refused with
+    ``other_ac`` set, so the caller connects to that AC itself. Commands run
+    one at a time on the shared client, which reconnects by itself whenever
+    the AC has dropped the socket.
+    """
+    import asyncio
+    import contextlib
+    import io
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("daemon mode needs Unix domain sockets")
+    if _daemon_running():
+        raise RuntimeError(f"a daemon is already listening on {DAEMON_SOCKET}")
+
     host, token, mac = resolve_config(args)
     client = await connect_client(host, token, mac)
+    duid = mac.translate(_MAC_TRANSLATE)
+    parser = build_parser()
+    lock = asyncio.Lock()
+
+    async def run(argv: list[str]) -> dict[str, object]:
+        try:
+            op_args = parser.parse_args(argv)
+        except SystemExit:
+            return {"ok": False, "output": "", "error": f"invalid command: {argv}"}
+        op = OPS.get(op_args.command)
+        if op is None:
+            return {
+                "ok": False,
+                "output": "",
+                "error": f"{op_args.command!r} cannot be run by the daemon",
+            }
+        async with lock:
+            out = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(out):
+                    try:
+                        await op(client, op_args)
+                    except _client_module().Samsung2878ConnectionError:
+                        # Stale socket: start over on a fresh connection once.
+                        await client.disconnect()
+                        out.seek(0)
+                        out.truncate()
+                        await op(client, op_args)
+            except Exception as err:  # noqa: BLE001
+                return {"ok": False, "output": out.getvalue(), "error": str(err)}
+            return {"ok": True, "output": out.getvalue()}
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    argv = request["argv"]
+                    mac_requested = str(request["mac"]).translate(_MAC_TRANSLATE)
+                    target = (request["host"], mac_requested)
+                except (ValueError, KeyError, TypeError):
+                    reply = {"ok": False, "output": "", "error": "bad request"}
+                else:
+                    if target != (host, duid):
+                        reply = {
+                            "ok": False,
+                            "output": "",
+                            "error": f"daemon serves {host}, not {target[0]}",
+                            "other_ac": True,
+                        }
+                    else:
+                        reply = await run([str(a) for a in argv])
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    # Anything left at the path is a stale socket (no daemon answered above).
+    DAEMON_SOCKET.unlink(missing_ok=True)
+    server = await asyncio.start_unix_server(handle, path=str(DAEMON_SOCKET))
+    # The socket controls the AC with the saved token; keep it private.
+    DAEMON_SOCKET.chmod(0o600)
+    print(f"Daemon listening on {DAEMON_SOCKET}", file=sys.stderr)
     try:
-        await client.reset_power_logging()
-        print("Power logging data reset.")
+        async with server:
+            await server.serve_forever()
     finally:
+        DAEMON_SOCKET.unlink(missing_ok=True)
         await client.disconnect()
 
 
-async def cmd_raw(args: argparse.Namespace) -> None:
-    host, token, mac = resolve_config(args)
-    client = await connect_client(host, token, mac)
+def _daemon_running() -> bool:
+    """Return True if something is accepting connections on DAEMON_SOCKET."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(DAEMON_SOCKET))
+        except OSError:
+            return False
+    return True
+
+
+def _daemon_request(argv: list[str], host: str, mac: str) -> dict[str, object] | None:
+    """Send a command line for the AC at ``host``/``mac`` to a running daemon.
+
+    Returns the daemon's reply, or None if no daemon answered (not listening,
+    stale socket, died or timed out mid-request) or it serves another AC, so
+    the caller can fall back to talking to the AC directly. The commands are
+    all "set to value", so repeating one after a lost reply is harmless.
+    """
+    if not hasattr(socket, "AF_UNIX") or not DAEMON_SOCKET.exists():
+        return None
+    request = {"argv": argv, "host": host, "mac": mac}
     try:
-        response = await client.send_raw_xml(args.xml)
-        print(response)
-    finally:
-        await client.disconnect()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_DAEMON_TIMEOUT)
+            sock.connect(str(DAEMON_SOCKET))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as reply:
+                line = reply.readline()
+        result = json.loads(line) if line else None
+    except (OSError, ValueError):  # socket.timeout is an OSError
+        return None
+    if not isinstance(result, dict) or result.get("other_ac"):
+        return None
+    return result
 
 
 def cmd_configure(args: argparse.Namespace) -> None:
@@ -350,7 +680,36 @@ def cmd_configure(args: argparse.Namespace) -> None:
         print(f"  {k}: {v}")
 
 
-def build_parser() -> argparse.ArgumentParser:
+# Every subcommand name, and the global options that take a value.
+_COMMANDS = frozenset({*OPS, "configure", "daemon", "batch", "status-all"})
+_VALUE_OPTIONS = ("--host", "--token", "--mac")
+
+
+def _sniff_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in ``argv``, or None if unsure.
+
+    Skips the global options (including argparse's abbreviations such as
+    ``--ho``) and their values, and looks at the first positional argument.
+    """
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg.startswith("-"):
+            skip_value = "=" not in arg and any(
+                option.startswith(arg) for option in _VALUE_OPTIONS if len(arg) > 2
+            )
+        else:
+            return arg if arg in _COMMANDS else None
+    return None
+
+
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    With ``command``, only that subcommand is registered: a normal invocation
+    runs a single command, so there is no point building the other parsers.
+    """
     parser = argparse.ArgumentParser(
         description="Samsung 2878 AC CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -362,77 +721,148 @@ def build_parser() -> argparse.ArgumentParser:
 
     sub = parser.add_subparsers(dest="command", required=True)
 
+    def wanted(name: str) -> bool:
+        return command is None or command == name
+
     # status
-    sub.add_parser("status", help="Show full AC state")
+    if wanted("status"):
+        sub.add_parser("status", help="Show full AC state")
 
     # on / off
-    sub.add_parser("on", help="Turn AC on")
-    sub.add_parser("off", help="Turn AC off")
+    if wanted("on"):
+        sub.add_parser("on", help="Turn AC on")
+    if wanted("off"):
+        sub.add_parser("off", help="Turn AC off")
 
     # mode
-    p = sub.add_parser("mode", help="Set operation mode")
-    p.add_argument("value", choices=["Auto", "Cool", "Heat", "Dry", "Wind"])
+    if wanted("mode"):
+        p = sub.add_parser("mode", help="Set operation mode")
+        p.add_argument("value", choices=_MODES)
 
     # temp
-    p = sub.add_parser("temp", help="Set target temperature")
-    p.add_argument("value", type=int, choices=range(16, 31), metavar="16-30")
+    if wanted("temp"):
+        p = sub.add_parser("temp", help="Set target temperature")
+        p.add_argument(
+            "value", type=_temperature, metavar=f"{_TEMP_MIN}-{_TEMP_MAX}"
+        )
 
     # fan
-    p = sub.add_parser("fan", help="Set fan speed")
-    p.add_argument("value", choices=["Auto", "Low", "Mid", "High", "Turbo"])
+    if wanted("fan"):
+        p = sub.add_parser("fan", help="Set fan speed")
+        p.add_argument("value", choices=_FAN_MODES)
 
     # swing
-    p = sub.add_parser("swing", help="Set swing direction")
-    p.add_argument(
-        "value",
-        choices=[
-            "Off", "Fixed", "SwingUD", "SwingLR", "Rotation",
-            "Indirect", "Direct", "Center", "Wide", "Left", "Right", "Long",
-        ],
-    )
+    if wanted("swing"):
+        p = sub.add_parser("swing", help="Set swing direction")
+        p.add_argument("value", choices=_SWING_MODES)
 
     # preset
-    p = sub.add_parser("preset", help="Set convenient mode")
-    p.add_argument("value", choices=["Off", "Quiet", "Sleep", "Smart", "SoftCool"])
+    if wanted("preset"):
+        p = sub.add_parser("preset", help="Set convenient mode")
+        p.add_argument("value", choices=_PRESETS)
 
     # autoclean
-    p = sub.add_parser("autoclean", help="Toggle auto clean")
-    p.add_argument("state", choices=["on", "off"])
+    if wanted("autoclean"):
+        p = sub.add_parser("autoclean", help="Toggle auto clean")
+        p.add_argument("state", choices=_ON_OFF)
 
     # spi
-    p = sub.add_parser("spi", help="Toggle ionizer (SPI)")
-    p.add_argument("state", choices=["on", "off"])
+    if wanted("spi"):
+        p = sub.add_parser("spi", help="Toggle ionizer (SPI)")
+        p.add_argument("state", choices=_ON_OFF)
 
     # sleep
-    p = sub.add_parser("sleep", help="Set sleep timer")
-    p.add_argument("minutes", type=int, help="Minutes (0=off, 1-420)")
+    if wanted("sleep"):
+        p = sub.add_parser("sleep", help="Set sleep timer")
+        p.add_argument("minutes", type=int, help="Minutes (0=off, 1-420)")
 
     # info
-    sub.add_parser("info", help="Show firmware versions")
+    if wanted("info"):
+        sub.add_parser("info", help="Show firmware versions")
 
     # power-log
-    p = sub.add_parser("power-log", help="Get power usage history")
-    p.add_argument("date_from", help="Start date (yy-MM-dd HH:mm)")
-    p.add_argument("date_to", help="End date (yy-MM-dd HH:mm)")
-    p.add_argument("--unit", default="Day", choices=["Hour", "Day"])
+    if wanted("power-log"):
+        p = sub.add_parser("power-log", help="Get power usage history")
+        p.add_argument("date_from", help="Start date (yy-MM-dd HH:mm)")
+        p.add_argument("date_to", help="End date (yy-MM-dd HH:mm)")
+        p.add_argument("--unit", default="Day", choices=_POWER_LOG_UNITS)
 
     # power-log-enable / disable / reset
-    sub.add_parser("power-log-enable", help="Enable power logging")
-    sub.add_parser("power-log-disable", help="Disable power logging")
-    sub.add_parser("power-log-reset", help="Reset power logging data")
+    if wanted("power-log-enable"):
+        sub.add_parser("power-log-enable", help="Enable power logging")
+    if wanted("power-log-disable"):
+        sub.add_parser("power-log-disable", help="Disable power logging")
+    if wanted("power-log-reset"):
+        sub.add_parser("power-log-reset", help="Reset power logging data")
 
     # raw
-    p = sub.add_parser("raw", help="Send raw XML command")
-    p.add_argument("xml", help="XML string to send")
+    if wanted("raw"):
+        p = sub.add_parser("raw", help="Send raw XML command")
+        p.add_argument("xml", help="XML string to send")
+
+    # status-all
+    if wanted("status-all"):
+        p = sub.add_parser(
+            "status-all",
+            help="Show the state of several ACs at once",
+            description=(
+                "Query several ACs concurrently. The devices file is a JSON "
+                'list of {"host", "token", "mac"} objects, each optionally '
+                'with a "name".'
+            ),
+        )
+        p.add_argument("--config", required=True, help="Devices JSON file")
+        p.add_argument(
+            "--max-concurrent",
+            type=_positive_int,
+            default=8,
+            help="Maximum simultaneous connections (default: 8)",
+        )
 
     # configure
-    sub.add_parser("configure", help="Save connection config")
+    if wanted("configure"):
+        sub.add_parser("configure", help="Save connection config")
+
+    # daemon
+    if wanted("daemon"):
+        sub.add_parser(
+            "daemon",
+            help="Keep the connection open and serve other invocations",
+            description=(
+                f"Hold one AC connection and serve commands on {DAEMON_SOCKET}. "
+                "While it runs, AC commands are forwarded to it unless "
+                "--host/--token/--mac are given."
+            ),
+        )
+
+    # batch
+    if wanted("batch"):
+        p = sub.add_parser(
+            "batch",
+            help="Run several commands over one connection",
+            description=(
+                "Run commands in order over a single connection, e.g. "
+                "batch --op on --op mode=Cool --op temp=22. "
+                "Each operation is NAME or NAME=VALUE."
+            ),
+        )
+        p.add_argument(
+            "--op",
+            action="append",
+            metavar="NAME[=VALUE]",
+            help="Operation to run",
+        )
+        p.add_argument(
+            "--file", help="JSON file with a list of NAME[=VALUE] operations"
+        )
 
     return parser
 
 
 def main() -> None:
-    parser = build_parser()
+    # Build only the parser for the command being run; --help, typos and
+    # other unclear command lines get the full parser.
+    parser = build_parser(_sniff_command(sys.argv[1:]))
     args = parser.parse_args()
 
     cmd = args.command
@@ -441,32 +871,39 @@ def main() -> None:
         cmd_configure(args)
         return
 
-    handler = {
-        "status": cmd_status,
-        "on": cmd_on,
-        "off": cmd_off,
-        "mode": cmd_mode,
-        "temp": cmd_temp,
-        "fan": cmd_fan,
-        "swing": cmd_swing,
-        "preset": cmd_preset,
-        "autoclean": cmd_autoclean,
-        "spi": cmd_spi,
-        "sleep": cmd_sleep,
-        "info": cmd_info,
-        "power-log": cmd_power_log,
-        "power-log-enable": cmd_power_log_enable,
-        "power-log-disable": cmd_power_log_disable,
-        "power-log-reset": cmd_power_log_reset,
-        "raw": cmd_raw,
-    }.get(cmd)
-
-    if handler is None:
+    if cmd in OPS and not (args.host or args.token or args.mac):
+        # Explicit connection flags may carry another token, so only implicit
+        # (saved/env) configuration is served by the daemon, and only if it
+        # resolves to the AC the daemon is connected to.
+        host, _token, mac = resolve_config(args)
+        reply = _daemon_request(sys.argv[1:], host, mac)
+        if reply is not None:
+            sys.stdout.write(str(reply.get("output", "")))
+            if not reply.get("ok"):
+                print(f"Error: {reply.get('error')}", file=sys.stderr)
+                sys.exit(1)
+            return
+
+    if cmd == "batch":
+        coro = cmd_batch(args)
+    elif cmd == "daemon":
+        coro = cmd_daemon(args)
+    elif cmd == "status-all":
+        coro = cmd_status_all(args)
+    elif (op := OPS.get(cmd)) is not None:
+        coro = cmd_single(args, op)
+    else:
         parser.print_help()
         sys.exit(1)
 
     try:
-        asyncio.run(handler(args))
+        # The CLI owns its event loop, so it can pick the faster one.
+        from uvloop import run
+    except ImportError:  # optional; also unavailable on Windows
+        from asyncio import run
+
+    try:
+        run(coro)
     except KeyboardInterrupt:
         pass
     except Exception as err:
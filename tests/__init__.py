@@ -0,0 +1 @@
+"""Tests for the Samsung 2878 AC integration."""
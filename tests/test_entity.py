@@ -0,0 +1,67 @@
+"""Tests for the Samsung 2878 base entity."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.samsung_2878.entity import Samsung2878Entity  # noqa: E402
+
+
+async def _set_auto_clean(on: bool) -> None:
+    """Stand-in client command; the coordinator mock never calls it."""
+
+
+def test_value_arriving_during_slow_send_is_sent() -> None:
+    """A value debounced while the previous send is in flight is not lost."""
+
+    async def run() -> list[bool]:
+        coordinator = MagicMock()
+        # The optimistic value of the first command is already shown.
+        coordinator.data = SimpleNamespace(auto_clean=True)
+        sent: list[bool] = []
+        release = asyncio.Event()
+
+        async def send_command(coro_func, value, optimistic):
+            sent.append(value)
+            if len(sent) == 1:
+                await release.wait()
+
+        coordinator.send_command = send_command
+        entity = Samsung2878Entity(coordinator)
+        # HA's Debouncer ignores async_call while its function is running.
+        entity._command_debouncer = MagicMock(async_call=AsyncMock())
+
+        entity._pending_command = (_set_auto_clean, True, {"auto_clean": True})
+        first = asyncio.create_task(entity._async_send_pending_command())
+        await asyncio.sleep(0)
+        await entity._async_send_debounced(
+            _set_auto_clean, False, {"auto_clean": False}
+        )
+        release.set()
+        await first
+        assert entity._pending_command is None
+        return sent
+
+    assert asyncio.run(run()) == [True, False]
+
+
+def test_failed_send_refreshes_state() -> None:
+    """A failed debounced send reconciles the optimistic state with the AC."""
+
+    async def run() -> MagicMock:
+        coordinator = MagicMock()
+        coordinator.send_command = AsyncMock(side_effect=RuntimeError("rejected"))
+        coordinator.async_request_refresh = AsyncMock()
+        entity = Samsung2878Entity(coordinator)
+        entity._pending_command = (_set_auto_clean, True, {"auto_clean": True})
+        with pytest.raises(RuntimeError):
+            await entity._async_send_pending_command()
+        return coordinator
+
+    asyncio.run(run()).async_request_refresh.assert_awaited_once()